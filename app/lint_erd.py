@@ -10,13 +10,132 @@ Usage:
     python -m app.lint_erd --generate-sql docs/erd.json
 """
 
+import functools
 import json
+import re
 import sys
+from operator import itemgetter
 from pathlib import Path
+from types import MappingProxyType
 from typing import List, Dict, Any, Tuple
-from pydantic import ValidationError
 
-from app.models import ERDModel
+import fastjsonschema
+import orjson
+
+# Finding message templates keyed by code. Findings are recorded as
+# (code, args) tuples and only formatted once, at report time, so the
+# common all-valid lint path skips string interpolation entirely.
+_MSGS = {
+    'load_failed': "Failed to load file {}: {}",
+    'validation_error': "Validation error at {}: {}",
+    'pk_missing': "Entity {} has no primary key",
+    'created_at_missing': "Entity {} missing created_at timestamp",
+    'updated_at_missing': "Entity {} missing updated_at timestamp",
+    'few_attributes': "Entity {} has very few attributes - consider if it's needed",
+    'rel_entity_missing': "Relationship {} references non-existent entity {}",
+    'fk_missing': "Foreign key {} not found in entity {}",
+    'orphan_entity': "Entity {} has no relationships - is this intentional?",
+    'entity_name_case': "Entity name '{}' should be PascalCase (e.g., 'UserProfile')",
+    'table_name_case': "Table name '{}' should be lowercase snake_case",
+    'attr_name_case': "Attribute '{}' in {} should be lowercase snake_case",
+    'fk_index_suggestion': "Consider adding index on foreign key '{}' in {} for better performance",
+    'wide_table': "Entity {} has {} attributes - consider normalization",
+}
+
+# Separator for validation-error locations, shared across joins.
+_SEP = " -> "
+
+# Naming-convention patterns, compiled once; a single C-level match
+# replaces several per-name str operations (and their lowered copies).
+_PASCAL = re.compile(r'^[A-Z][A-Za-z0-9]*$')
+_SNAKE = re.compile(r'^[a-z][a-z0-9_]*$')
+
+# SQL statement templates, built once at import and rendered with
+# str.format so per-call generation is pure substitution.
+_SQL_HEADER_TEMPLATE = (
+    "-- Generated schema for {project_name}\n"
+    "-- Database type: {database_type}\n"
+    "-- Generated at: {created_at}"
+)
+_SQL_INDEX_TEMPLATE = "CREATE {unique}INDEX {index_name} ON {table_name} ({columns});"
+
+# Generic-to-database column type mapping, shared read-only across calls.
+_TYPE_MAPPING = MappingProxyType({
+    'postgres': MappingProxyType({
+        'UUID': 'UUID',
+        'INTEGER': 'INTEGER',
+        'STRING': 'VARCHAR(255)',
+        'TEXT': 'TEXT',
+        'BOOLEAN': 'BOOLEAN',
+        'DATETIME': 'TIMESTAMP WITH TIME ZONE'
+    }),
+})
+_SQL_FOREIGN_KEY_TEMPLATE = (
+    "ALTER TABLE {from_table} ADD FOREIGN KEY ({fk_field})"
+    " REFERENCES {to_table}({pk_field}){cascade};"
+)
+
+# Attribute-name extractor shared by the validation hot loops; itemgetter
+# skips the per-call dict.get default handling.
+_name_of = itemgetter('name')
+
+
+def _intern_ids(data: Dict[str, Any]):
+    """Intern entity-ID strings in place, once, right after parsing.
+
+    Entity IDs recur across the entity index, relationship endpoints, and
+    FK lookups; interning lets those dict/set operations hit CPython's
+    pointer-equality fast path instead of hashing and comparing bytes.
+    """
+    erd_data = data.get('data')
+    if not isinstance(erd_data, dict):
+        return
+
+    for entity in erd_data.get('entities') or ():
+        if isinstance(entity.get('id'), str):
+            entity['id'] = sys.intern(entity['id'])
+
+    for rel in erd_data.get('relationships') or ():
+        if isinstance(rel.get('from_entity'), str):
+            rel['from_entity'] = sys.intern(rel['from_entity'])
+        if isinstance(rel.get('to_entity'), str):
+            rel['to_entity'] = sys.intern(rel['to_entity'])
+
+
+@functools.lru_cache(maxsize=4096)
+def _column_def(name, data_type, primary_key, nullable, unique, default, db_type) -> str:
+    """Build one column definition; memoized since attribute shapes repeat."""
+    mapped_type = _TYPE_MAPPING.get(db_type, {}).get(data_type, data_type)
+    col_def = f"{name} {mapped_type}"
+
+    if primary_key:
+        col_def += " PRIMARY KEY"
+
+    if not nullable:
+        col_def += " NOT NULL"
+
+    if unique:
+        col_def += " UNIQUE"
+
+    if default is not None:
+        col_def += f" DEFAULT {default}"
+
+    return col_def
+
+
+@functools.cache
+def _compiled_erd_validator():
+    """Compile the ERD JSON Schema once per process.
+
+    The compiled schema is a flat generated function, so repeated lint
+    calls skip Pydantic's recursive per-field validation entirely.
+
+    `app.models` is imported lazily here so CLI paths that never validate
+    (--help, argument errors) skip the Pydantic model-building cost.
+    """
+    from app.models import ERDModel
+
+    return fastjsonschema.compile(ERDModel.model_json_schema())
 
 
 class ERDLinter:
@@ -26,21 +145,36 @@ class ERDLinter:
         self.errors = []
         self.warnings = []
         self.suggestions = []
-    
-    def lint_file(self, file_path: str) -> Tuple[bool, Dict[str, Any]]:
+        self._last_data = None
+
+    def _err(self, code: str, *args):
+        """Record an error as (code, args); formatting is deferred to report time."""
+        self.errors.append((code, args))
+
+    def _warn(self, code: str, *args):
+        self.warnings.append((code, args))
+
+    def _suggest(self, code: str, *args):
+        self.suggestions.append((code, args))
+
+    def lint_file(self, file_path: str, skip_pydantic: bool = False) -> Tuple[bool, Dict[str, Any]]:
         """Lint an ERD JSON file."""
         try:
             erd_data = self._load_json(file_path)
-            return self.lint_data(erd_data)
+            # Cache the parsed dict so callers (e.g. --generate-sql) don't
+            # re-read and re-parse the same file.
+            self._last_data = erd_data
+            return self.lint_data(erd_data, skip_pydantic)
         except Exception as e:
-            self.errors.append(f"Failed to load file {file_path}: {e}")
+            self._err('load_failed', file_path, e)
             return False, self._generate_report()
-    
-    def lint_data(self, data: Dict[str, Any]) -> Tuple[bool, Dict[str, Any]]:
+
+    def lint_data(self, data: Dict[str, Any], skip_pydantic: bool = False) -> Tuple[bool, Dict[str, Any]]:
         """Lint ERD data structure."""
-        
-        # 1. Pydantic validation
-        pydantic_valid = self._validate_pydantic(data)
+
+        # 1. Pydantic validation (skippable for known-good files, where the
+        #    deep schema walk dominates and the design checks are cheap)
+        pydantic_valid = True if skip_pydantic else self._validate_pydantic(data)
         
         # 2. Database design validation
         self._validate_database_design(data)
@@ -65,26 +199,32 @@ class ERDLinter:
         erd_data = data['data']
         database_type = erd_data.get('database_type', 'postgres')
         
-        sql_parts = []
-        sql_parts.append(f"-- Generated schema for {erd_data.get('project_name', 'Unknown Project')}")
-        sql_parts.append(f"-- Database type: {database_type}")
-        sql_parts.append(f"-- Generated at: {erd_data.get('created_at', 'Unknown')}")
-        sql_parts.append("")
-        
-        # Generate table creation statements
+        sql_parts = [
+            _SQL_HEADER_TEMPLATE.format(
+                project_name=erd_data.get('project_name', 'Unknown Project'),
+                database_type=database_type,
+                created_at=erd_data.get('created_at', 'Unknown'),
+            ),
+            "",
+        ]
+
+        # Single entity traversal: collect table statements directly and
+        # buffer index statements so they still emit as one block below.
+        index_parts = []
         for entity in erd_data.get('entities', []):
             sql_parts.append(self._generate_table_sql(entity, database_type))
             sql_parts.append("")
-        
-        # Generate indexes
-        for entity in erd_data.get('entities', []):
             for index in entity.get('indexes', []):
-                sql_parts.append(self._generate_index_sql(entity, index, database_type))
-        
+                index_parts.append(self._generate_index_sql(entity, index, database_type))
+
+        sql_parts.extend(index_parts)
+
         # Generate foreign key constraints
-        for relationship in erd_data.get('relationships', []):
-            sql_parts.append(self._generate_foreign_key_sql(relationship, erd_data))
-        
+        sql_parts.extend(
+            self._generate_foreign_key_sql(relationship, erd_data)
+            for relationship in erd_data.get('relationships', [])
+        )
+
         return "\n".join(sql_parts)
     
     def _load_json(self, file_path: str) -> Dict[str, Any]:
@@ -93,17 +233,20 @@ class ERDLinter:
         if not path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
         
-        return json.loads(path.read_text())
+        # orjson parses straight from bytes, skipping the decode + pure-Python
+        # parse cost of json.loads(path.read_text()) on large artifacts.
+        data = orjson.loads(path.read_bytes())
+        _intern_ids(data)
+        return data
     
     def _validate_pydantic(self, data: Dict[str, Any]) -> bool:
-        """Validate against Pydantic model."""
+        """Validate against the compiled ERD schema."""
         try:
-            ERDModel(**data)
+            _compiled_erd_validator()(data)
             return True
-        except ValidationError as e:
-            for error in e.errors():
-                location = " -> ".join(str(loc) for loc in error['loc'])
-                self.errors.append(f"Validation error at {location}: {error['msg']}")
+        except fastjsonschema.JsonSchemaException as e:
+            location = _SEP.join(map(str, e.path[1:])) or "root"
+            self._err('validation_error', location, e.message)
             return False
     
     def _validate_database_design(self, data: Dict[str, Any]):
@@ -113,25 +256,28 @@ class ERDLinter:
         
         erd_data = data['data']
         entities = erd_data.get('entities', [])
-        
-        # Check for entities without primary keys
+
+        # Single pass per entity: primary key, timestamps, and column count
+        # checks share one attribute traversal instead of re-walking the list.
         for entity in entities:
-            has_pk = any(attr.get('primary_key', False) for attr in entity.get('attributes', []))
+            attributes = entity.get('attributes', [])
+            name = entity.get('name')
+
+            # Check for entities without primary keys
+            has_pk = any(attr.get('primary_key', False) for attr in attributes)
             if not has_pk:
-                self.errors.append(f"Entity {entity.get('name')} has no primary key")
-        
-        # Check for missing timestamps (common pattern)
-        for entity in entities:
-            attrs = [attr['name'] for attr in entity.get('attributes', [])]
-            if 'created_at' not in attrs:
-                self.warnings.append(f"Entity {entity.get('name')} missing created_at timestamp")
-            if 'updated_at' not in attrs:
-                self.warnings.append(f"Entity {entity.get('name')} missing updated_at timestamp")
-        
-        # Check for single-column entities (usually design smell)
-        for entity in entities:
-            if len(entity.get('attributes', [])) <= 2:  # PK + one other field
-                self.warnings.append(f"Entity {entity.get('name')} has very few attributes - consider if it's needed")
+                self._err('pk_missing', name)
+
+            # Check for missing timestamps (common pattern)
+            attr_names = set(map(_name_of, attributes))
+            if 'created_at' not in attr_names:
+                self._warn('created_at_missing', name)
+            if 'updated_at' not in attr_names:
+                self._warn('updated_at_missing', name)
+
+            # Check for single-column entities (usually design smell)
+            if len(attributes) <= 2:  # PK + one other field
+                self._warn('few_attributes', name)
     
     def _validate_relationships(self, data: Dict[str, Any]):
         """Validate entity relationships."""
@@ -141,34 +287,35 @@ class ERDLinter:
         erd_data = data['data']
         entities = {e['id']: e for e in erd_data.get('entities', [])}
         relationships = erd_data.get('relationships', [])
-        
+
+        # Single pass over relationships: reference checks, FK checks, and
+        # the seen-entity set for orphan detection share one traversal.
+        seen = set()
         for rel in relationships:
             from_id = rel.get('from_entity')
             to_id = rel.get('to_entity')
-            
+            seen.add(from_id)
+            seen.add(to_id)
+
             # Check entity references exist
             if from_id not in entities:
-                self.errors.append(f"Relationship {rel.get('id')} references non-existent entity {from_id}")
+                self._err('rel_entity_missing', rel.get('id'), from_id)
             if to_id not in entities:
-                self.errors.append(f"Relationship {rel.get('id')} references non-existent entity {to_id}")
-            
+                self._err('rel_entity_missing', rel.get('id'), to_id)
+
             # Check foreign key exists in from_entity
             if from_id in entities:
                 from_entity = entities[from_id]
                 fk_field = rel.get('foreign_key')
-                attr_names = [attr['name'] for attr in from_entity.get('attributes', [])]
+                attr_names = set(map(_name_of, from_entity.get('attributes') or ()))
                 if fk_field not in attr_names:
-                    self.errors.append(f"Foreign key {fk_field} not found in entity {from_entity.get('name')}")
-        
-        # Check for orphaned entities (no relationships)
-        entity_ids_in_rels = set()
-        for rel in relationships:
-            entity_ids_in_rels.add(rel.get('from_entity'))
-            entity_ids_in_rels.add(rel.get('to_entity'))
-        
-        for entity_id, entity in entities.items():
-            if entity_id not in entity_ids_in_rels and len(entities) > 1:
-                self.warnings.append(f"Entity {entity.get('name')} has no relationships - is this intentional?")
+                    self._err('fk_missing', fk_field, from_entity.get('name'))
+
+        # Check for orphaned entities (no relationships) with a C-level
+        # set difference instead of a per-entity membership loop.
+        if len(entities) > 1:
+            for entity_id in entities.keys() - seen:
+                self._warn('orphan_entity', entities[entity_id].get('name'))
     
     def _validate_naming_conventions(self, data: Dict[str, Any]):
         """Validate naming conventions."""
@@ -182,19 +329,20 @@ class ERDLinter:
             name = entity.get('name', '')
             table_name = entity.get('table_name', '')
             
-            # Entity names should be PascalCase
-            if not name[0].isupper() or '_' in name:
-                self.warnings.append(f"Entity name '{name}' should be PascalCase (e.g., 'UserProfile')")
-            
+            # Entity names should be PascalCase (the match also rejects
+            # empty names, which used to raise IndexError on name[0])
+            if not _PASCAL.match(name):
+                self._warn('entity_name_case', name)
+
             # Table names should be snake_case and plural
-            if table_name.lower() != table_name or ' ' in table_name:
-                self.warnings.append(f"Table name '{table_name}' should be lowercase snake_case")
-            
+            if not _SNAKE.match(table_name):
+                self._warn('table_name_case', table_name)
+
             # Attribute naming
             for attr in entity.get('attributes', []):
                 attr_name = attr.get('name', '')
-                if attr_name.lower() != attr_name or ' ' in attr_name:
-                    self.warnings.append(f"Attribute '{attr_name}' in {name} should be lowercase snake_case")
+                if not _SNAKE.match(attr_name):
+                    self._warn('attr_name_case', attr_name, name)
     
     def _check_performance_considerations(self, data: Dict[str, Any]):
         """Check for performance issues."""
@@ -203,28 +351,34 @@ class ERDLinter:
         
         erd_data = data['data']
         
-        # Check for missing indexes on foreign keys
+        # Check for missing indexes on foreign keys. Indexed columns are
+        # collected once per entity up front; the relationship loop then
+        # only does set lookups instead of rebuilding the set per rel.
         entities = {e['id']: e for e in erd_data.get('entities', [])}
         relationships = erd_data.get('relationships', [])
-        
+
+        indexed_by_entity = {
+            eid: frozenset(
+                column
+                for index in entity.get('indexes', ())
+                for column in index.get('columns', ())
+            )
+            for eid, entity in entities.items()
+        }
+
         for rel in relationships:
             from_id = rel.get('from_entity')
             fk_field = rel.get('foreign_key')
-            
+
             if from_id in entities:
-                entity = entities[from_id]
-                indexed_columns = set()
-                for index in entity.get('indexes', []):
-                    indexed_columns.update(index.get('columns', []))
-                
-                if fk_field not in indexed_columns:
-                    self.suggestions.append(f"Consider adding index on foreign key '{fk_field}' in {entity.get('name')} for better performance")
+                if fk_field not in indexed_by_entity[from_id]:
+                    self._suggest('fk_index_suggestion', fk_field, entities[from_id].get('name'))
         
         # Check for very wide tables (normalization issue)
         for entity in erd_data.get('entities', []):
             attr_count = len(entity.get('attributes', []))
             if attr_count > 15:
-                self.warnings.append(f"Entity {entity.get('name')} has {attr_count} attributes - consider normalization")
+                self._warn('wide_table', entity.get('name'), attr_count)
     
     def _generate_table_sql(self, entity: Dict[str, Any], db_type: str) -> str:
         """Generate CREATE TABLE SQL for entity."""
@@ -244,37 +398,15 @@ class ERDLinter:
     
     def _generate_column_definition(self, attr: Dict[str, Any], db_type: str) -> str:
         """Generate column definition SQL."""
-        name = attr.get('name')
-        data_type = attr.get('type', 'TEXT')
-        
-        # Map generic types to database-specific types
-        type_mapping = {
-            'postgres': {
-                'UUID': 'UUID',
-                'INTEGER': 'INTEGER',
-                'STRING': 'VARCHAR(255)',
-                'TEXT': 'TEXT',
-                'BOOLEAN': 'BOOLEAN',
-                'DATETIME': 'TIMESTAMP WITH TIME ZONE'
-            }
-        }
-        
-        mapped_type = type_mapping.get(db_type, {}).get(data_type, data_type)
-        col_def = f"{name} {mapped_type}"
-        
-        if attr.get('primary_key'):
-            col_def += " PRIMARY KEY"
-        
-        if not attr.get('nullable', True):
-            col_def += " NOT NULL"
-        
-        if attr.get('unique'):
-            col_def += " UNIQUE"
-        
-        if attr.get('default') is not None:
-            col_def += f" DEFAULT {attr['default']}"
-        
-        return col_def
+        return _column_def(
+            attr.get('name'),
+            attr.get('type', 'TEXT'),
+            bool(attr.get('primary_key')),
+            attr.get('nullable', True),
+            bool(attr.get('unique')),
+            attr.get('default'),
+            db_type,
+        )
     
     def _generate_index_sql(self, entity: Dict[str, Any], index: Dict[str, Any], db_type: str) -> str:
         """Generate CREATE INDEX SQL."""
@@ -283,7 +415,9 @@ class ERDLinter:
         columns = ', '.join(index.get('columns', []))
         
         unique = "UNIQUE " if index.get('unique') else ""
-        return f"CREATE {unique}INDEX {index_name} ON {table_name} ({columns});"
+        return _SQL_INDEX_TEMPLATE.format(
+            unique=unique, index_name=index_name, table_name=table_name, columns=columns
+        )
     
     def _generate_foreign_key_sql(self, relationship: Dict[str, Any], erd_data: Dict[str, Any]) -> str:
         """Generate foreign key constraint SQL."""
@@ -306,8 +440,16 @@ class ERDLinter:
         if relationship.get('cascade_delete'):
             cascade = " ON DELETE CASCADE"
         
-        return f"ALTER TABLE {from_table} ADD FOREIGN KEY ({fk_field}) REFERENCES {to_table}({pk_field}){cascade};"
+        return _SQL_FOREIGN_KEY_TEMPLATE.format(
+            from_table=from_table, fk_field=fk_field,
+            to_table=to_table, pk_field=pk_field, cascade=cascade
+        )
     
+    @staticmethod
+    def _format_findings(findings: List[Tuple[str, tuple]]) -> List[str]:
+        """Format recorded (code, args) findings into report messages."""
+        return [_MSGS[code].format(*args) for code, args in findings]
+
     def _generate_report(self) -> Dict[str, Any]:
         """Generate validation report."""
         return {
@@ -315,64 +457,113 @@ class ERDLinter:
             "error_count": len(self.errors),
             "warning_count": len(self.warnings),
             "suggestion_count": len(self.suggestions),
-            "errors": self.errors,
-            "warnings": self.warnings,
-            "suggestions": self.suggestions
+            "errors": self._format_findings(self.errors),
+            "warnings": self._format_findings(self.warnings),
+            "suggestions": self._format_findings(self.suggestions)
         }
 
 
-def main():
-    """CLI entry point."""
-    import argparse
-    
-    parser = argparse.ArgumentParser(description="Validate ERD JSON files")
-    parser.add_argument("file", help="Path to ERD JSON file")
-    parser.add_argument("--generate-sql", action="store_true", help="Generate SQL schema")
-    parser.add_argument("--output", "-o", help="Output file for generated SQL")
-    parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
-    
-    args = parser.parse_args()
-    
-    linter = ERDLinter()
-    is_valid, report = linter.lint_file(args.file)
-    
-    # Print results
+def _lint_one(file_path: str, skip_pydantic: bool = False) -> Tuple[str, bool, Dict[str, Any]]:
+    """Lint a single file with a fresh linter (process-pool worker)."""
+    is_valid, report = ERDLinter().lint_file(file_path, skip_pydantic)
+    return file_path, is_valid, report
+
+
+def lint_many(file_paths: List[str], skip_pydantic: bool = False) -> List[Tuple[str, bool, Dict[str, Any]]]:
+    """Lint many ERD files in parallel.
+
+    Each worker process pays the Pydantic import and schema-compile cost
+    once and then reuses it across its chunk of files, so batch runs
+    (e.g. CI over a docs tree) scale with available cores.
+    """
+    if len(file_paths) == 1:
+        return [_lint_one(file_paths[0], skip_pydantic)]
+
+    import os
+    from concurrent.futures import ProcessPoolExecutor
+    from itertools import repeat
+
+    workers = min(len(file_paths), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_lint_one, file_paths, repeat(skip_pydantic), chunksize=4))
+
+
+def _print_report(file_path: str, is_valid: bool, report: Dict[str, Any], verbose: bool):
+    """Print the lint result for one file."""
     if is_valid:
-        print(f"✅ ERD validation passed: {args.file}")
+        print(f"✅ ERD validation passed: {file_path}")
     else:
-        print(f"❌ ERD validation failed: {args.file}")
-    
-    if args.verbose or not is_valid:
+        print(f"❌ ERD validation failed: {file_path}")
+
+    if verbose or not is_valid:
         print(f"\nValidation Report:")
         print(f"- Errors: {report['error_count']}")
         print(f"- Warnings: {report['warning_count']}")
         print(f"- Suggestions: {report['suggestion_count']}")
-        
+
         for error in report['errors']:
             print(f"  ERROR: {error}")
-        
+
         for warning in report['warnings']:
             print(f"  WARNING: {warning}")
-        
+
         for suggestion in report['suggestions']:
             print(f"  SUGGESTION: {suggestion}")
-    
-    # Generate SQL if requested
+
+
+def main():
+    """CLI entry point."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Validate ERD JSON files")
+    parser.add_argument("file", nargs="+", help="Path(s) to ERD JSON file; multiple files lint in parallel")
+    parser.add_argument("--generate-sql", action="store_true", help="Generate SQL schema (single-file runs only)")
+    parser.add_argument("--output", "-o", help="Output file for generated SQL")
+    parser.add_argument("--skip-pydantic", action="store_true",
+                        help="Skip Pydantic schema validation (design checks only)")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
+
+    args = parser.parse_args()
+
+    if args.skip_pydantic:
+        print("⚠ Skipping Pydantic schema validation (--skip-pydantic)", file=sys.stderr)
+
+    if len(args.file) == 1:
+        # Single-file path stays in-process so --generate-sql can reuse
+        # the parsed dict cached by lint_file.
+        file_path = args.file[0]
+        linter = ERDLinter()
+        is_valid, report = linter.lint_file(file_path, args.skip_pydantic)
+        _print_report(file_path, is_valid, report, args.verbose)
+
+        # Generate SQL if requested
+        if args.generate_sql:
+            try:
+                erd_data = linter._last_data
+                if erd_data is None:
+                    erd_data = json.loads(Path(file_path).read_text())
+                sql_schema = linter.generate_sql_schema(erd_data)
+
+                if args.output:
+                    Path(args.output).write_text(sql_schema)
+                    print(f"\n📄 SQL schema generated: {args.output}")
+                else:
+                    print("\n--- Generated SQL Schema ---")
+                    print(sql_schema)
+            except Exception as e:
+                print(f"\n❌ Failed to generate SQL: {e}")
+
+        sys.exit(0 if is_valid else 1)
+
     if args.generate_sql:
-        try:
-            erd_data = json.loads(Path(args.file).read_text())
-            sql_schema = linter.generate_sql_schema(erd_data)
-            
-            if args.output:
-                Path(args.output).write_text(sql_schema)
-                print(f"\n📄 SQL schema generated: {args.output}")
-            else:
-                print("\n--- Generated SQL Schema ---")
-                print(sql_schema)
-        except Exception as e:
-            print(f"\n❌ Failed to generate SQL: {e}")
-    
-    sys.exit(0 if is_valid else 1)
+        print("⚠ --generate-sql is only supported for single-file runs", file=sys.stderr)
+
+    all_valid = True
+    for file_path, is_valid, report in lint_many(args.file, args.skip_pydantic):
+        _print_report(file_path, is_valid, report, args.verbose)
+        all_valid = all_valid and is_valid
+
+    sys.exit(0 if all_valid else 1)
 
 
 if __name__ == "__main__":
@@ -21,10 +21,176 @@ All models follow the stable ID conventions:
 - etc.
 """
 
+import dataclasses
+import functools
+import os
+import re
+from collections import Counter, deque
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional, Any, Union
-from pydantic import BaseModel, Field, EmailStr, field_validator
+from typing import Annotated, Dict, List, Literal, Optional, Any, Tuple, Union, get_args, get_origin
+from typing_extensions import NotRequired, TypedDict
+from pydantic import (
+    BaseModel, ConfigDict, Field, EmailStr, StrictBool, StrictInt, StrictStr,
+    PrivateAttr, TypeAdapter, field_validator, model_validator,
+)
+
+
+# Config shared by the top-level artifact models. Deferring the
+# pydantic-core build moves validator construction from import time to
+# the first actual validation, which keeps `import app.models` cheap for
+# CLI paths that never validate.
+ARTIFACT_MODEL_CONFIG = ConfigDict(defer_build=True)
+
+# Config shared by small leaf models that are instantiated in large lists
+# (attributes, file changes, checklist rows, ...). frozen=True installs
+# pydantic's cheap raising __setattr__; extra='ignore' pins the no-extras
+# fast path explicitly. (BaseModel has no slots option in pydantic v2, so
+# the per-instance __dict__ remains.)
+LEAF_MODEL_CONFIG = ConfigDict(frozen=True, extra='ignore')
+
+# Default approver rosters for the human approval gates. Immutable
+# tuples take pydantic's identity path for defaults, skipping the deep
+# copy it performs on mutable list defaults at every construction.
+_DESIGN_APPROVERS = ("Cynthia", "Hermann")
+_PRD_APPROVERS = ("Cynthia", "Hermann", "Usama")
+_FLOW_APPROVERS = ("Cynthia", "Hassan")
+_ERD_APPROVERS = ("Cynthia", "Hassan", "Usama")
+_JOURNEY_APPROVERS = ("Cynthia", "Hassan")
+_TASKS_APPROVERS = ("Cynthia", "Hermann", "Usama")
+_ADR_APPROVERS = ("Hermann", "Usama")
+_SCAFFOLD_APPROVERS = ("Cynthia", "Usama")
+_IMPL_APPROVERS = ("Mustaffa", "Usama")
+
+# Kebab-case domain names, compiled once; the bound-method match call in
+# the validator skips re's per-call pattern-cache lookup.
+_KEBAB_RE = re.compile(r'^[a-z][a-z0-9]*(-[a-z0-9]+)*$')
+
+# Testing strategies that require test_files to be present.
+_AUTOMATED_STRATEGIES = frozenset({"unit", "integration", "e2e"})
+
+# Shared TypeAdapter cache. Building a TypeAdapter constructs a full
+# pydantic-core validator/serializer, which is orders of magnitude more
+# expensive than reusing one - callers should use get_adapter(Model)
+# instead of instantiating TypeAdapter(Model) ad hoc.
+get_adapter = functools.lru_cache(maxsize=None)(TypeAdapter)
+
+
+# ============================================================================
+# Trusted fast-path loading
+# ============================================================================
+
+def _nested_model(annotation):
+    """Return (nested_model_cls, kind) for an annotation, or (None, None).
+
+    kind is 'one' for a direct nested model, 'list' for List[Model], and
+    'dict' for Dict[str, Model]. Optional[...] wrappers are unwrapped.
+    """
+    origin = get_origin(annotation)
+    if origin is Union:
+        args = [a for a in get_args(annotation) if a is not type(None)]
+        if len(args) == 1:
+            return _nested_model(args[0])
+        return None, None
+    if origin is list:
+        (item,) = get_args(annotation) or (None,)
+        if isinstance(item, type) and issubclass(item, BaseModel):
+            return item, 'list'
+        return None, None
+    if origin is dict:
+        args = get_args(annotation)
+        if len(args) == 2 and isinstance(args[1], type) and issubclass(args[1], BaseModel):
+            return args[1], 'dict'
+        return None, None
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation, 'one'
+    return None, None
+
+
+@functools.lru_cache(maxsize=None)
+def _construct_plan(model_cls):
+    """Per-class constructor plan: (field_name, nested_cls, kind) tuples.
+
+    Computed once per model from model_fields so each trusted load is a
+    flat dict walk with no annotation introspection.
+    """
+    return tuple(
+        (name, *_nested_model(field.annotation))
+        for name, field in model_cls.model_fields.items()
+    )
+
+
+def _construct_trusted(model_cls, data: Dict[str, Any]):
+    """Recursively model_construct a model tree without validation."""
+    built = {}
+    for name, nested, kind in _construct_plan(model_cls):
+        if name not in data:
+            continue
+        value = data[name]
+        if nested is None or value is None:
+            built[name] = value
+        elif kind == 'list':
+            built[name] = [_construct_trusted(nested, item) for item in value]
+        elif kind == 'dict':
+            built[name] = {k: _construct_trusted(nested, item) for k, item in value.items()}
+        else:
+            built[name] = _construct_trusted(nested, value)
+    return model_cls.model_construct(**built)
+
+
+class TrustedLoadMixin:
+    """Adds a validation-skipping constructor for already-validated artifacts.
+
+    Pipeline phases re-load artifacts that were validated when written;
+    re-running model_validate on them dominates load time. from_trusted
+    rebuilds the model tree via model_construct instead, but only when the
+    operator opts in with TRUSTED_LOAD=1 - untrusted ingress still goes
+    through full validation.
+    """
+
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]):
+        if os.environ.get("TRUSTED_LOAD") != "1":
+            return cls.model_validate(data)
+        return _construct_trusted(cls, data)
+
+
+# ============================================================================
+# Stable ID aliases
+# ============================================================================
+# One Annotated alias per ID family. Each alias carries a single
+# Field(pattern=...) so pydantic-core compiles the regex validator once
+# and shares it across every field that uses the family, instead of
+# building (and holding) a separate compiled pattern per inline
+# Field(pattern=...) occurrence.
+
+EntityId = Annotated[str, Field(pattern=r"^ENT-\d{3}$")]
+RelationshipId = Annotated[str, Field(pattern=r"^REL-\d{3}$")]
+FeatureId = Annotated[str, Field(pattern=r"^FR-\d{3}$")]
+StoryId = Annotated[str, Field(pattern=r"^ST-\d{3}$")]
+StepId = Annotated[str, Field(pattern=r"^STEP-\d{3}$")]
+FlowId = Annotated[str, Field(pattern=r"^FLOW-\d{3}$")]
+SystemFlowId = Annotated[str, Field(pattern=r"^SFLOW-\d{3}$")]
+PersonaId = Annotated[str, Field(pattern=r"^PERSONA-\d{3}$")]
+TouchpointId = Annotated[str, Field(pattern=r"^TP-\d{3}$")]
+PhaseId = Annotated[str, Field(pattern=r"^PHASE-\d{3}$")]
+JourneyId = Annotated[str, Field(pattern=r"^JRN-\d{3}$")]
+OpportunityId = Annotated[str, Field(pattern=r"^OPP-\d{3}$")]
+EpicId = Annotated[str, Field(pattern=r"^EPIC-\d{3}$")]
+TaskId = Annotated[str, Field(pattern=r"^TASK-\d{3}$")]
+SprintId = Annotated[str, Field(pattern=r"^SPRINT-\d{3}$")]
+AdrId = Annotated[str, Field(pattern=r"^ADR-\d{4}$")]
+ScaffoldId = Annotated[str, Field(pattern=r"^SCAFFOLD-\d{3}$")]
+
+# Single alternation covering every stable ID format above. Tools that
+# scan artifact text for cross-references (triage reports, consistency
+# checks) find all IDs in one pass instead of one finditer per prefix;
+# callers classify matches afterwards with a cheap startswith on the
+# prefix. Word boundaries keep substrings like "XTASK-001x" from matching.
+ID_SCANNER = re.compile(
+    r"\b(?:ENT|REL|FR|ST|STEP|FLOW|SFLOW|JRN|PERSONA|TP|PHASE|OPP|EPIC|TASK|"
+    r"SPRINT|SCAFFOLD|ADR)-\d{3,4}\b"
+)
 
 
 # ============================================================================
@@ -89,6 +255,18 @@ class ArchitectureStyle(str, Enum):
     LAYERED = "layered"                     # Traditional layers
 
 
+# Literal mirrors of the bulk-validated enums. pydantic-core checks a
+# Literal with one interned-string compare instead of an enum lookup plus
+# member instantiation per row, which adds up across thousands of tasks
+# and touchpoints. The Enum classes above stay for symbolic access; they
+# are str subclasses, so comparisons like task.type == TaskType.BACKEND
+# still hold against the plain string values.
+TaskTypeValue = Literal["backend", "frontend", "database", "devops", "testing", "documentation"]
+EmotionalStateValue = Literal["curious", "frustrated", "confident", "confused", "satisfied"]
+ADRStatusValue = Literal["proposed", "accepted", "rejected", "deprecated", "superseded"]
+PriorityValue = Literal["high", "medium", "low"]
+
+
 # ============================================================================
 # Domain Mapping Models (for Propose-Validate-Confirm pattern)
 # ============================================================================
@@ -105,16 +283,15 @@ class DomainSchema(BaseModel):
     """
     name: str = Field(..., min_length=2, max_length=50, description="Domain name in kebab-case, e.g., 'sales', 'user-management'")
     description: str = Field(..., min_length=10, description="Business purpose of this domain")
-    root_entity: str = Field(..., pattern=r"^ENT-\d{3}$", description="Aggregate root entity ID - the domain's entry point")
-    entities: List[str] = Field(..., min_items=1, description="List of entity IDs belonging to this domain")
+    root_entity: EntityId = Field(..., description="Aggregate root entity ID - the domain's entry point")
+    entities: List[str] = Field(..., min_length=1, description="List of entity IDs belonging to this domain")
     feature_ids: List[str] = Field(default_factory=list, description="PRD features this domain implements")
     dependencies: List[str] = Field(default_factory=list, description="Other domain names this domain depends on")
 
     @field_validator('name', mode='after')
     def validate_kebab_case(cls, v):
         """Ensure domain name is kebab-case."""
-        import re
-        if not re.match(r'^[a-z][a-z0-9]*(-[a-z0-9]+)*$', v):
+        if not _KEBAB_RE.match(v):
             raise ValueError(f"Domain name must be kebab-case: {v}")
         return v
 
@@ -124,66 +301,145 @@ class DomainMapping(BaseModel):
     Complete domain map for a project.
     Generated during PRD→ERD phase, validated before scaffolding.
     """
-    domains: List[DomainSchema] = Field(..., min_items=1, description="All domains in the project")
+    domains: List[DomainSchema] = Field(..., min_length=1, description="All domains in the project")
     shared_entities: List[str] = Field(default_factory=list, description="Entity IDs shared across domains")
     dependency_graph: Dict[str, List[str]] = Field(default_factory=dict, description="Domain dependency relationships")
 
-    @field_validator('domains', mode='after')
-    def validate_unique_domain_names(cls, v):
-        """Ensure domain names are unique."""
-        names = [d.name for d in v]
-        if len(names) != len(set(names)):
+    _topological_order: Tuple[str, ...] = PrivateAttr(default=())
+
+    @model_validator(mode='after')
+    def validate_domains(self):
+        """Check name uniqueness and detect circular dependencies.
+
+        One validator (and one traversal) covers both checks. The single
+        pass builds the name->dependencies dict that uniqueness, the cycle
+        check, and the stored dependency_graph all need - if the field
+        arrived empty it is populated here so downstream consumers never
+        rebuild it from the domain list.
+
+        Cycle detection is an iterative Kahn's algorithm: peel off
+        zero-in-degree domains with a deque; anything left unemitted sits
+        on (or behind) a cycle. Avoids the per-edge Python call overhead
+        of the old recursive DFS. Dependencies on unknown domain names are
+        ignored - they cannot close a cycle. The reversed emit order puts
+        dependencies before their dependents, memoized for repeated
+        scheduling reads.
+        """
+        deps = {d.name: d.dependencies for d in self.domains}
+        if len(deps) != len(self.domains):
             raise ValueError("Domain names must be unique")
-        return v
 
-    @field_validator('domains', mode='after')
-    def validate_no_circular_dependencies(cls, v):
-        """Detect circular dependencies between domains."""
-        # Build dependency graph
-        deps = {d.name: d.dependencies for d in v}
-
-        def has_cycle(node, visited, rec_stack):
-            visited.add(node)
-            rec_stack.add(node)
-            for neighbor in deps.get(node, []):
-                if neighbor not in visited:
-                    if has_cycle(neighbor, visited, rec_stack):
-                        return True
-                elif neighbor in rec_stack:
-                    return True
-            rec_stack.remove(node)
-            return False
-
-        visited = set()
-        for domain in v:
-            if domain.name not in visited:
-                if has_cycle(domain.name, visited, set()):
-                    raise ValueError(f"Circular dependency detected involving domain: {domain.name}")
-        return v
+        in_degree = Counter()
+        for dependencies in deps.values():
+            in_degree.update(dep for dep in dependencies if dep in deps)
+
+        queue = deque(name for name in deps if not in_degree[name])
+        order = []
+        while queue:
+            node = queue.popleft()
+            order.append(node)
+            for neighbor in deps[node]:
+                if neighbor in deps:
+                    in_degree[neighbor] -= 1
+                    if not in_degree[neighbor]:
+                        queue.append(neighbor)
+
+        if len(order) < len(deps):
+            cyclic = next(name for name in deps if in_degree[name])
+            raise ValueError(f"Circular dependency detected involving domain: {cyclic}")
+
+        if not self.dependency_graph:
+            self.dependency_graph = {name: list(ds) for name, ds in deps.items()}
+        self._topological_order = tuple(reversed(order))
+        return self
+
+    @property
+    def topological_order(self) -> Tuple[str, ...]:
+        """Dependency-safe domain ordering, computed once during validation."""
+        return self._topological_order
 
 
 # ============================================================================
 # Design Brief Models (for UI/UX configuration)
 # ============================================================================
 
+# Shared #rrggbb hex-color alias, mirroring the stable-ID aliases above:
+# one compiled regex validator serves all ten color fields instead of
+# pydantic-core building a separate pattern node per field declaration.
+HexColor = Annotated[str, Field(pattern=r"^#[0-9a-fA-F]{6}$")]
+
+
 class ColorScheme(BaseModel):
     """Color configuration for the design system."""
-    primary: str = Field(..., pattern=r"^#[0-9a-fA-F]{6}$", description="Primary brand color in hex")
-    secondary: Optional[str] = Field(None, pattern=r"^#[0-9a-fA-F]{6}$", description="Secondary color")
-    accent: List[str] = Field(default_factory=list, description="Accent colors in hex")
-    background: str = Field(default="#ffffff", pattern=r"^#[0-9a-fA-F]{6}$")
-    surface: str = Field(default="#f8f9fa", pattern=r"^#[0-9a-fA-F]{6}$")
-    text_primary: str = Field(default="#1a1a1a", pattern=r"^#[0-9a-fA-F]{6}$")
-    text_secondary: str = Field(default="#6b7280", pattern=r"^#[0-9a-fA-F]{6}$")
-    success: str = Field(default="#10b981", pattern=r"^#[0-9a-fA-F]{6}$")
-    warning: str = Field(default="#f59e0b", pattern=r"^#[0-9a-fA-F]{6}$")
-    error: str = Field(default="#ef4444", pattern=r"^#[0-9a-fA-F]{6}$")
+    model_config = LEAF_MODEL_CONFIG
+    primary: HexColor = Field(..., description="Primary brand color in hex")
+    secondary: Optional[HexColor] = Field(None, description="Secondary color")
+    accent: Tuple[str, ...] = Field(default=(), description="Accent colors in hex")
+    background: HexColor = "#ffffff"
+    surface: HexColor = "#f8f9fa"
+    text_primary: HexColor = "#1a1a1a"
+    text_secondary: HexColor = "#6b7280"
+    success: HexColor = "#10b981"
+    warning: HexColor = "#f59e0b"
+    error: HexColor = "#ef4444"
+
+    @functools.cached_property
+    def packed(self) -> Dict[str, Any]:
+        """Colors as packed 0xRRGGBB ints, parsed once per instance.
+
+        Palette math (opacity blends, derived shades) works on the ints
+        instead of re-parsing the '#rrggbb' strings at every use; the
+        stored and serialized representation stays the hex string.
+        """
+        packed = {
+            name: int(value[1:], 16)
+            for name, value in self.__dict__.items()
+            if isinstance(value, str) and value.startswith('#')
+        }
+        packed['accent'] = tuple(int(c[1:], 16) for c in self.accent)
+        return packed
+
+
+# Preset palettes are pure value objects, so the three instances are
+# built (and validated) once at import and shared by every from_preset
+# call. Pydantic does not revalidate model instances on assignment, so
+# reuse costs nothing per call.
+_PRESET_COLORS = {
+    DesignPreset.CREATIVE: ColorScheme(
+        primary="#3b82f6",      # Blue
+        secondary="#8b5cf6",    # Violet
+        accent=["#ef4444", "#8b5cf6"],  # Red + Violet
+        background="#ffffff",
+        surface="#f0f9ff",
+        text_primary="#1e3a5f",
+        text_secondary="#64748b"
+    ),
+    DesignPreset.CORPORATE: ColorScheme(
+        primary="#14b8a6",      # Teal Green
+        secondary="#0d9488",
+        accent=["#0891b2"],
+        background="#ffffff",
+        surface="#f0fdfa",
+        text_primary="#134e4a",
+        text_secondary="#64748b"
+    ),
+    DesignPreset.NEUTRAL: ColorScheme(
+        primary="#6b7280",       # Gray
+        secondary="#3b82f6",     # Blue
+        accent=["#ef4444", "#3b82f6"],  # Red + Blue patches
+        background="#ffffff",
+        surface="#f9fafb",
+        text_primary="#1f2937",
+        text_secondary="#6b7280"
+    )
+}
 
 
 class GlassmorphismConfig(BaseModel):
     """Glassmorphism UI configuration."""
+    model_config = LEAF_MODEL_CONFIG
     enabled: bool = Field(default=True, description="Whether to use glassmorphism effects")
-    blur_intensity: str = Field(default="xl", pattern=r"^(sm|md|lg|xl|2xl|3xl)$")
+    blur_intensity: Literal["sm", "md", "lg", "xl", "2xl", "3xl"] = "xl"
     opacity: float = Field(default=0.7, ge=0.1, le=1.0, description="Background opacity for glass effect")
     border_opacity: float = Field(default=0.3, ge=0.1, le=1.0)
     shadow_color_opacity: float = Field(default=0.1, ge=0.0, le=0.5)
@@ -192,6 +448,7 @@ class GlassmorphismConfig(BaseModel):
 
 class TypographyConfig(BaseModel):
     """Typography configuration."""
+    model_config = LEAF_MODEL_CONFIG
     font_family_heading: str = Field(default="Inter", description="Font for headings")
     font_family_body: str = Field(default="Inter", description="Font for body text")
     font_family_mono: str = Field(default="JetBrains Mono", description="Font for code")
@@ -199,6 +456,24 @@ class TypographyConfig(BaseModel):
     scale_ratio: float = Field(default=1.25, ge=1.0, le=2.0, description="Type scale ratio")
 
 
+# Shared default sub-configs: both models are frozen value objects, so
+# every DesignBrief that omits them reuses one instance instead of
+# constructing a fresh model per brief.
+_DEFAULT_GLASS = GlassmorphismConfig()
+_DEFAULT_TYPO = TypographyConfig()
+
+# Default Tailwind breakpoints, hoisted so the per-instance default is a
+# single dict.copy() of a prebuilt table instead of a lambda rebuilding
+# the five entries from literals on every DesignBrief construction.
+_DEFAULT_BREAKPOINTS = {
+    "sm": "640px",
+    "md": "768px",
+    "lg": "1024px",
+    "xl": "1280px",
+    "2xl": "1536px",
+}
+
+
 class DesignBrief(BaseModel):
     """
     Complete design system configuration for a generated project.
@@ -212,70 +487,42 @@ class DesignBrief(BaseModel):
     """
     preset: DesignPreset = Field(default=DesignPreset.NEUTRAL, description="Color preset to use")
     colors: ColorScheme = Field(default_factory=ColorScheme)
-    glassmorphism: GlassmorphismConfig = Field(default_factory=GlassmorphismConfig)
-    typography: TypographyConfig = Field(default_factory=TypographyConfig)
+    glassmorphism: GlassmorphismConfig = Field(default=_DEFAULT_GLASS)
+    typography: TypographyConfig = Field(default=_DEFAULT_TYPO)
     dark_mode_support: bool = Field(default=True)
-    responsive_breakpoints: Dict[str, str] = Field(
-        default_factory=lambda: {
-            "sm": "640px",
-            "md": "768px",
-            "lg": "1024px",
-            "xl": "1280px",
-            "2xl": "1536px"
-        }
-    )
-    component_style: str = Field(
+    responsive_breakpoints: Dict[str, str] = Field(default_factory=_DEFAULT_BREAKPOINTS.copy)
+    component_style: Literal["rounded", "sharp", "pill"] = Field(
         default="rounded",
-        pattern=r"^(rounded|sharp|pill)$",
         description="Border radius style for components"
     )
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def from_preset(cls, preset: DesignPreset) -> "DesignBrief":
-        """Factory method to create DesignBrief from preset."""
-        presets = {
-            DesignPreset.CREATIVE: ColorScheme(
-                primary="#3b82f6",      # Blue
-                secondary="#8b5cf6",    # Violet
-                accent=["#ef4444", "#8b5cf6"],  # Red + Violet
-                background="#ffffff",
-                surface="#f0f9ff",
-                text_primary="#1e3a5f",
-                text_secondary="#64748b"
-            ),
-            DesignPreset.CORPORATE: ColorScheme(
-                primary="#14b8a6",      # Teal Green
-                secondary="#0d9488",
-                accent=["#0891b2"],
-                background="#ffffff",
-                surface="#f0fdfa",
-                text_primary="#134e4a",
-                text_secondary="#64748b"
-            ),
-            DesignPreset.NEUTRAL: ColorScheme(
-                primary="#6b7280",       # Gray
-                secondary="#3b82f6",     # Blue
-                accent=["#ef4444", "#3b82f6"],  # Red + Blue patches
-                background="#ffffff",
-                surface="#f9fafb",
-                text_primary="#1f2937",
-                text_secondary="#6b7280"
-            )
-        }
+        """Factory method to create DesignBrief from preset.
 
+        Pure function of a tiny enum, so results are memoized: at most
+        one DesignBrief is ever built per preset per process. Returned
+        instances are shared - treat them as read-only and model_copy
+        before mutating.
+
+        Preset palettes come from the shared module-level instances, so
+        no ColorScheme is rebuilt or revalidated per call.
+        """
         if preset == DesignPreset.CUSTOM:
             return cls(preset=preset)
 
-        return cls(preset=preset, colors=presets.get(preset, presets[DesignPreset.NEUTRAL]))
+        return cls(preset=preset, colors=_PRESET_COLORS.get(preset, _PRESET_COLORS[DesignPreset.NEUTRAL]))
 
 
-class DesignBriefModel(BaseModel):
+class DesignBriefModel(TrustedLoadMixin, BaseModel):
     """Artifact wrapper for design brief."""
+    model_config = ARTIFACT_MODEL_CONFIG
     artifact_type: str = Field(default="design_brief")
     status: str = Field(default="complete")
     validation: ValidationStatus
     approval_required: bool = Field(default=True)
-    approvers: List[str] = Field(default=["Cynthia", "Hermann"])
+    approvers: Tuple[str, ...] = Field(default=_DESIGN_APPROVERS)
     next_phase: str = Field(default="scaffolding")
     data: DesignBrief
 
@@ -284,40 +531,46 @@ class DesignBriefModel(BaseModel):
 # PRD Models
 # ============================================================================
 
-class AcceptanceCriteria(BaseModel):
-    criteria: str = Field(..., description="Testable acceptance criteria")
-    priority: PriorityLevel = Field(default=PriorityLevel.MEDIUM)
+class AcceptanceCriteria(TypedDict):
+    """Leaf payload validated as a TypedDict - no per-instance model cost."""
+    criteria: Annotated[str, Field(description="Testable acceptance criteria")]
+    priority: NotRequired[PriorityLevel]
 
 
 class UserStory(BaseModel):
-    id: str = Field(..., pattern=r"^ST-\d{3}$", description="Story ID format: ST-001")
+    id: StoryId = Field(..., description="Story ID format: ST-001")
     title: str = Field(..., min_length=5, max_length=100)
     description: str = Field(..., description="As a [user], I want [goal] so that [benefit]")
-    acceptance_criteria: List[str] = Field(..., min_items=1)
+    acceptance_criteria: List[str] = Field(..., min_length=1)
     priority: PriorityLevel = Field(default=PriorityLevel.MEDIUM)
 
 
 class Feature(BaseModel):
-    id: str = Field(..., pattern=r"^FR-\d{3}$", description="Feature ID format: FR-001")
+    id: FeatureId = Field(..., description="Feature ID format: FR-001")
     title: str = Field(..., min_length=5, max_length=100)
     description: str = Field(..., min_length=20)
     priority: PriorityLevel = Field(default=PriorityLevel.MEDIUM)
-    user_stories: List[UserStory] = Field(..., min_items=1)
+    user_stories: List[UserStory] = Field(..., min_length=1)
 
 
-class TechnicalRequirement(BaseModel):
-    performance: Dict[str, Any] = Field(default_factory=dict)
-    security: Dict[str, Any] = Field(default_factory=dict)
-    scalability: Dict[str, Any] = Field(default_factory=dict)
-    compatibility: Dict[str, Any] = Field(default_factory=dict)
+class TechnicalRequirement(TypedDict):
+    """Leaf payload validated as a TypedDict - no per-instance model cost."""
+    performance: NotRequired[Dict[str, Any]]
+    security: NotRequired[Dict[str, Any]]
+    scalability: NotRequired[Dict[str, Any]]
+    compatibility: NotRequired[Dict[str, Any]]
 
 
 class PRDData(BaseModel):
+    # Deferred so the EmailStr core schema - and with it the
+    # email_validator import - is only built on first validation instead
+    # of at module import.
+    model_config = ARTIFACT_MODEL_CONFIG
     project_name: str = Field(..., min_length=3, max_length=100)
     owner_email: EmailStr
     created_at: datetime
     version: str = Field(default="1.0.0")
-    features: List[Feature] = Field(..., min_items=1)
+    features: List[Feature] = Field(..., min_length=1)
     technical_requirements: TechnicalRequirement = Field(default_factory=TechnicalRequirement)
     dependencies: List[str] = Field(default_factory=list)
     assumptions: List[str] = Field(default_factory=list)
@@ -325,18 +578,24 @@ class PRDData(BaseModel):
 
     @field_validator('features', mode='after')
     def validate_unique_feature_ids(cls, v):
-        ids = [f.id for f in v]
-        if len(ids) != len(set(ids)):
-            raise ValueError("Feature IDs must be unique")
+        # Single incremental pass: no intermediate id list, and the loop
+        # short-circuits on the first duplicate instead of materializing
+        # a full set to compare lengths.
+        seen = set()
+        for f in v:
+            if f.id in seen:
+                raise ValueError(f"Feature IDs must be unique (duplicate: {f.id})")
+            seen.add(f.id)
         return v
 
 
-class PRDModel(BaseModel):
+class PRDModel(TrustedLoadMixin, BaseModel):
+    model_config = ARTIFACT_MODEL_CONFIG
     artifact_type: str = Field(default="prd")
     status: str = Field(default="complete")
     validation: ValidationStatus
     approval_required: bool = Field(default=True)
-    approvers: List[str] = Field(default=["Cynthia", "Hermann", "Usama"])
+    approvers: Tuple[str, ...] = Field(default=_PRD_APPROVERS)
     next_phase: str = Field(default="flow_design")
     data: PRDData
 
@@ -345,36 +604,37 @@ class PRDModel(BaseModel):
 # Flow Models
 # ============================================================================
 
-class FlowStep(BaseModel):
-    id: str = Field(..., pattern=r"^STEP-\d{3}$", description="Step ID format: STEP-001")
-    sequence: int = Field(..., ge=1)
-    action: str = Field(..., min_length=5)
-    actor: str = Field(..., description="user|system|admin")
-    inputs: List[str] = Field(default_factory=list)
-    outputs: List[str] = Field(default_factory=list)
-    conditions: List[str] = Field(default_factory=list)
-    next_steps: List[str] = Field(default_factory=list)
+class FlowStep(TypedDict):
+    """Leaf payload validated as a TypedDict - no per-instance model cost."""
+    id: Annotated[StepId, Field(description="Step ID format: STEP-001")]
+    sequence: Annotated[int, Field(ge=1)]
+    action: Annotated[str, Field(min_length=5)]
+    actor: Annotated[str, Field(description="user|system|admin")]
+    inputs: NotRequired[List[str]]
+    outputs: NotRequired[List[str]]
+    conditions: NotRequired[List[str]]
+    next_steps: NotRequired[List[str]]
 
 
 class UserFlow(BaseModel):
-    id: str = Field(..., pattern=r"^FLOW-\d{3}$", description="Flow ID format: FLOW-001")
+    id: FlowId = Field(..., description="Flow ID format: FLOW-001")
     name: str = Field(..., min_length=5, max_length=100)
     description: str = Field(..., min_length=10)
-    feature_id: str = Field(..., pattern=r"^FR-\d{3}$")
-    story_ids: List[str] = Field(..., min_items=1)
+    feature_id: FeatureId
+    story_ids: List[str] = Field(..., min_length=1)
     actor: str = Field(..., description="user|admin|system")
     trigger: str = Field(..., min_length=5)
-    steps: List[FlowStep] = Field(..., min_items=1)
-    success_criteria: List[str] = Field(..., min_items=1)
+    steps: List[FlowStep] = Field(..., min_length=1)
+    success_criteria: List[str] = Field(..., min_length=1)
     error_handling: List[str] = Field(default_factory=list)
 
 
 class SystemFlow(BaseModel):
-    id: str = Field(..., pattern=r"^SFLOW-\d{3}$", description="System Flow ID format: SFLOW-001")
+    id: SystemFlowId = Field(..., description="System Flow ID format: SFLOW-001")
     name: str = Field(..., min_length=5, max_length=100)
     description: str = Field(..., min_length=10)
-    components: List[str] = Field(..., min_items=1)
-    steps: List[FlowStep] = Field(..., min_items=1)
+    components: List[str] = Field(..., min_length=1)
+    steps: List[FlowStep] = Field(..., min_length=1)
     data_flow: List[str] = Field(default_factory=list)
     error_handling: List[str] = Field(default_factory=list)
 
@@ -383,18 +643,19 @@ class FlowData(BaseModel):
     project_name: str = Field(..., min_length=3, max_length=100)
     version: str = Field(default="1.0.0")
     created_at: datetime
-    user_flows: List[UserFlow] = Field(..., min_items=1)
+    user_flows: List[UserFlow] = Field(..., min_length=1)
     system_flows: List[SystemFlow] = Field(default_factory=list)
     integrations: List[str] = Field(default_factory=list)
     assumptions: List[str] = Field(default_factory=list)
 
 
-class FlowModel(BaseModel):
+class FlowModel(TrustedLoadMixin, BaseModel):
+    model_config = ARTIFACT_MODEL_CONFIG
     artifact_type: str = Field(default="flow")
     status: str = Field(default="complete")
     validation: ValidationStatus
     approval_required: bool = Field(default=True)
-    approvers: List[str] = Field(default=["Cynthia", "Hassan"])
+    approvers: Tuple[str, ...] = Field(default=_FLOW_APPROVERS)
     next_phase: str = Field(default="erd_design")
     data: FlowData
 
@@ -404,35 +665,43 @@ class FlowModel(BaseModel):
 # ============================================================================
 
 class EntityAttribute(BaseModel):
+    model_config = LEAF_MODEL_CONFIG
     name: str = Field(..., min_length=1, max_length=50)
     type: str = Field(..., description="UUID|INTEGER|STRING|BOOLEAN|DATETIME|etc")
     primary_key: bool = Field(default=False)
     nullable: bool = Field(default=True)
     unique: bool = Field(default=False)
-    default: Optional[Union[str, int, bool]] = None
+    # Attribute defaults are the most-hit union in an ERD. left_to_right
+    # short-circuits on the first matching branch (cheapest first) instead
+    # of smart-mode scoring every branch; the strict branch types keep
+    # JSON round-trips exact (1 stays an int, true stays a bool).
+    default: Optional[
+        Annotated[Union[StrictBool, StrictInt, StrictStr], Field(union_mode='left_to_right')]
+    ] = None
     constraints: List[str] = Field(default_factory=list)
 
 
 class EntityIndex(BaseModel):
+    model_config = LEAF_MODEL_CONFIG
     name: str = Field(..., min_length=1, max_length=100)
-    columns: List[str] = Field(..., min_items=1)
+    columns: List[str] = Field(..., min_length=1)
     unique: bool = Field(default=False)
 
 
 class Entity(BaseModel):
-    id: str = Field(..., pattern=r"^ENT-\d{3}$", description="Entity ID format: ENT-001")
+    id: EntityId = Field(..., description="Entity ID format: ENT-001")
     name: str = Field(..., min_length=1, max_length=50)
     description: str = Field(..., min_length=10)
     table_name: str = Field(..., min_length=1, max_length=50)
-    attributes: List[EntityAttribute] = Field(..., min_items=1)
+    attributes: List[EntityAttribute] = Field(..., min_length=1)
     indexes: List[EntityIndex] = Field(default_factory=list)
 
 
 class Relationship(BaseModel):
-    id: str = Field(..., pattern=r"^REL-\d{3}$", description="Relationship ID format: REL-001")
+    id: RelationshipId = Field(..., description="Relationship ID format: REL-001")
     name: str = Field(..., min_length=1, max_length=100)
-    from_entity: str = Field(..., pattern=r"^ENT-\d{3}$")
-    to_entity: str = Field(..., pattern=r"^ENT-\d{3}$")
+    from_entity: EntityId
+    to_entity: EntityId
     from_cardinality: str = Field(..., description="1|many")
     to_cardinality: str = Field(..., description="1|many")
     relationship_type: str = Field(..., description="one-to-one|one-to-many|many-to-many")
@@ -442,7 +711,7 @@ class Relationship(BaseModel):
 
 class ERDConstraint(BaseModel):
     type: str = Field(..., description="check|unique|foreign_key")
-    entity: str = Field(..., pattern=r"^ENT-\d{3}$")
+    entity: EntityId
     name: str = Field(..., min_length=1)
     expression: str = Field(..., min_length=1)
 
@@ -457,18 +726,19 @@ class ERDData(BaseModel):
     version: str = Field(default="1.0.0")
     created_at: datetime
     database_type: str = Field(..., description="postgres|mysql|mongodb|etc")
-    entities: List[Entity] = Field(..., min_items=1)
+    entities: List[Entity] = Field(..., min_length=1)
     relationships: List[Relationship] = Field(default_factory=list)
     constraints: List[ERDConstraint] = Field(default_factory=list)
     migrations: ERDMigrations
 
 
-class ERDModel(BaseModel):
+class ERDModel(TrustedLoadMixin, BaseModel):
+    model_config = ARTIFACT_MODEL_CONFIG
     artifact_type: str = Field(default="erd")
     status: str = Field(default="complete")
     validation: ValidationStatus
     approval_required: bool = Field(default=True)
-    approvers: List[str] = Field(default=["Cynthia", "Hassan", "Usama"])
+    approvers: Tuple[str, ...] = Field(default=_ERD_APPROVERS)
     next_phase: str = Field(default="journey_mapping")
     data: ERDData
 
@@ -478,60 +748,65 @@ class ERDModel(BaseModel):
 # ============================================================================
 
 class Persona(BaseModel):
-    id: str = Field(..., pattern=r"^PERSONA-\d{3}$", description="Persona ID format: PERSONA-001")
+    id: PersonaId = Field(..., description="Persona ID format: PERSONA-001")
     name: str = Field(..., min_length=3, max_length=50)
     description: str = Field(..., min_length=10)
-    goals: List[str] = Field(..., min_items=1)
+    goals: List[str] = Field(..., min_length=1)
     pain_points: List[str] = Field(default_factory=list)
     context: str = Field(..., min_length=10)
 
 
 class Touchpoint(BaseModel):
-    id: str = Field(..., pattern=r"^TP-\d{3}$", description="Touchpoint ID format: TP-001")
+    id: TouchpointId = Field(..., description="Touchpoint ID format: TP-001")
     name: str = Field(..., min_length=3, max_length=100)
     type: TouchpointType
     description: str = Field(..., min_length=10)
-    flow_step_id: Optional[str] = Field(None, pattern=r"^STEP-\d{3}$")
+    flow_step_id: Optional[StepId] = None
     data_entities: List[str] = Field(default_factory=list)
     user_actions: List[str] = Field(default_factory=list)
     system_actions: List[str] = Field(default_factory=list)
-    emotional_state: EmotionalState
+    emotional_state: EmotionalStateValue
     pain_points: List[str] = Field(default_factory=list)
     opportunities: List[str] = Field(default_factory=list)
 
+    def to_dto(self) -> "TouchpointDTO":
+        """Return a read-only slotted mirror for analytics consumers."""
+        return TouchpointDTO(**self.__dict__)
+
 
 class JourneyPhase(BaseModel):
-    id: str = Field(..., pattern=r"^PHASE-\d{3}$", description="Phase ID format: PHASE-001")
+    id: PhaseId = Field(..., description="Phase ID format: PHASE-001")
     name: str = Field(..., min_length=3, max_length=100)
     description: str = Field(..., min_length=10)
     duration_estimate: str = Field(..., description="e.g., '5 minutes', '1 hour'")
-    touchpoints: List[Touchpoint] = Field(..., min_items=1)
+    touchpoints: List[Touchpoint] = Field(..., min_length=1)
 
 
 class SuccessMetric(BaseModel):
+    model_config = LEAF_MODEL_CONFIG
     metric: str = Field(..., min_length=3)
     target: str = Field(..., min_length=1)
     measurement: str = Field(..., min_length=5)
 
 
 class Journey(BaseModel):
-    id: str = Field(..., pattern=r"^JRN-\d{3}$", description="Journey ID format: JRN-001")
+    id: JourneyId = Field(..., description="Journey ID format: JRN-001")
     name: str = Field(..., min_length=5, max_length=100)
     description: str = Field(..., min_length=10)
-    persona_id: str = Field(..., pattern=r"^PERSONA-\d{3}$")
-    flow_ids: List[str] = Field(..., min_items=1)
-    story_ids: List[str] = Field(..., min_items=1)
-    phases: List[JourneyPhase] = Field(..., min_items=1)
-    success_metrics: List[SuccessMetric] = Field(..., min_items=1)
+    persona_id: PersonaId
+    flow_ids: List[str] = Field(..., min_length=1)
+    story_ids: List[str] = Field(..., min_length=1)
+    phases: List[JourneyPhase] = Field(..., min_length=1)
+    success_metrics: List[SuccessMetric] = Field(..., min_length=1)
 
 
 class OptimizationOpportunity(BaseModel):
-    id: str = Field(..., pattern=r"^OPP-\d{3}$", description="Opportunity ID format: OPP-001")
+    id: OpportunityId = Field(..., description="Opportunity ID format: OPP-001")
     title: str = Field(..., min_length=5, max_length=100)
     description: str = Field(..., min_length=10)
     impact: PriorityLevel
     effort: PriorityLevel
-    touchpoint_ids: List[str] = Field(..., min_items=1)
+    touchpoint_ids: List[str] = Field(..., min_length=1)
     expected_improvement: str = Field(..., min_length=10)
 
 
@@ -539,17 +814,18 @@ class JourneyData(BaseModel):
     project_name: str = Field(..., min_length=3, max_length=100)
     version: str = Field(default="1.0.0")
     created_at: datetime
-    personas: List[Persona] = Field(..., min_items=1)
-    journeys: List[Journey] = Field(..., min_items=1)
+    personas: List[Persona] = Field(..., min_length=1)
+    journeys: List[Journey] = Field(..., min_length=1)
     optimization_opportunities: List[OptimizationOpportunity] = Field(default_factory=list)
 
 
-class JourneyModel(BaseModel):
+class JourneyModel(TrustedLoadMixin, BaseModel):
+    model_config = ARTIFACT_MODEL_CONFIG
     artifact_type: str = Field(default="journey")
     status: str = Field(default="complete")
     validation: ValidationStatus
     approval_required: bool = Field(default=True)
-    approvers: List[str] = Field(default=["Cynthia", "Hassan"])
+    approvers: Tuple[str, ...] = Field(default=_JOURNEY_APPROVERS)
     next_phase: str = Field(default="task_planning")
     data: JourneyData
 
@@ -559,80 +835,91 @@ class JourneyModel(BaseModel):
 # ============================================================================
 
 class Epic(BaseModel):
-    id: str = Field(..., pattern=r"^EPIC-\d{3}$", description="Epic ID format: EPIC-001")
+    id: EpicId = Field(..., description="Epic ID format: EPIC-001")
     title: str = Field(..., min_length=5, max_length=100)
     description: str = Field(..., min_length=10)
-    feature_ids: List[str] = Field(..., min_items=1)
-    priority: PriorityLevel
+    feature_ids: List[str] = Field(..., min_length=1)
+    priority: PriorityValue
     estimated_sprints: int = Field(..., ge=1)
-    success_criteria: List[str] = Field(..., min_items=1)
+    success_criteria: List[str] = Field(..., min_length=1)
 
 
 class ContextPlan(BaseModel):
     """Context planning for task execution."""
-    beginning_context: List[str] = Field(..., min_items=1, description="Files to load at task start")
-    end_state_files: List[str] = Field(..., min_items=1, description="Files that must exist after completion")
+    beginning_context: List[str] = Field(..., min_length=1, description="Files to load at task start")
+    end_state_files: List[str] = Field(..., min_length=1, description="Files that must exist after completion")
     read_only_files: List[str] = Field(default_factory=list, description="Files to read but not modify")
 
 class TestingStrategy(BaseModel):
     """Testing approach for task validation."""
-    strategy_type: str = Field(..., pattern=r"^(integration|unit|e2e|manual)$")
+    strategy_type: Literal["integration", "unit", "e2e", "manual"]
     test_files: List[str] = Field(default_factory=list)  # Can be empty for manual testing
-    success_criteria: List[str] = Field(..., min_items=1)
+    success_criteria: List[str] = Field(..., min_length=1)
     test_command: Optional[str] = None
 
     @field_validator('test_files', mode='after')
     def validate_test_files_for_automated_testing(cls, v, info):
-        """For automated testing (unit, integration, e2e), test_files is required."""
-        data = info.data
-        strategy_type = data.get('strategy_type', '')
-        if strategy_type in ('unit', 'integration', 'e2e') and len(v) == 0:
-            raise ValueError(f"test_files required for {strategy_type} testing strategy")
+        """For automated testing (unit, integration, e2e), test_files is required.
+
+        The emptiness check runs first so the common non-empty case
+        short-circuits before the strategy-set membership lookup.
+        """
+        if not v and info.data.get('strategy_type') in _AUTOMATED_STRATEGIES:
+            raise ValueError(f"test_files required for {info.data['strategy_type']} testing strategy")
         return v
 
 class Task(BaseModel):
-    id: str = Field(..., pattern=r"^TASK-\d{3}$", description="Task ID format: TASK-001")
+    # The optional reference lists default to a shared empty tuple rather
+    # than default_factory=list: omitted fields reuse one immutable
+    # singleton instead of allocating a fresh list per field per task,
+    # which adds up across large task boards. Incoming lists still
+    # validate normally; the references are read-only cross-links.
+    id: TaskId = Field(..., description="Task ID format: TASK-001")
     title: str = Field(..., min_length=5, max_length=100)
     description: str = Field(..., min_length=10)
-    type: TaskType
-    epic_id: Optional[str] = Field(None, pattern=r"^EPIC-\d{3}$")
-    feature_id: Optional[str] = Field(None, pattern=r"^FR-\d{3}$")
-    story_ids: List[str] = Field(default_factory=list)
-    entity_ids: List[str] = Field(default_factory=list)
-    flow_ids: List[str] = Field(default_factory=list)
-    journey_ids: List[str] = Field(default_factory=list)
+    type: TaskTypeValue
+    epic_id: Optional[EpicId] = None
+    feature_id: Optional[FeatureId] = None
+    story_ids: Tuple[str, ...] = ()
+    entity_ids: Tuple[str, ...] = ()
+    flow_ids: Tuple[str, ...] = ()
+    journey_ids: Tuple[str, ...] = ()
     priority: PriorityLevel
     story_points: int = Field(..., ge=1, le=8, description="Story points 1-8")
     estimated_hours: int = Field(..., ge=1)
     assignee: str = Field(..., min_length=3)
-    dependencies: List[str] = Field(default_factory=list, description="List of TASK-### IDs")
-    blocked_by: List[str] = Field(default_factory=list)
-    acceptance_criteria: List[str] = Field(..., min_items=1)
-    definition_of_done: List[str] = Field(..., min_items=1)
+    dependencies: Tuple[str, ...] = Field(default=(), description="List of TASK-### IDs")
+    blocked_by: Tuple[str, ...] = ()
+    acceptance_criteria: List[str] = Field(..., min_length=1)
+    definition_of_done: List[str] = Field(..., min_length=1)
     technical_notes: Optional[str] = None
-    risks: List[str] = Field(default_factory=list)
-    tags: List[str] = Field(default_factory=list)
-    
+    risks: Tuple[str, ...] = ()
+    tags: Tuple[str, ...] = ()
+
     # Enhanced context planning
     context_plan: ContextPlan
     testing_strategy: TestingStrategy
     estimated_time: str = Field(..., description="Human readable time estimate, e.g., '2 hours', '1 day'")
-    scope_boundaries: List[str] = Field(default_factory=list, description="What is explicitly out of scope")
+    scope_boundaries: Tuple[str, ...] = Field(default=(), description="What is explicitly out of scope")
+
+    def to_dto(self) -> "TaskDTO":
+        """Return a read-only slotted mirror for scheduling consumers."""
+        return TaskDTO(**self.__dict__)
 
 
 class Sprint(BaseModel):
-    id: str = Field(..., pattern=r"^SPRINT-\d{3}$", description="Sprint ID format: SPRINT-001")
+    id: SprintId = Field(..., description="Sprint ID format: SPRINT-001")
     name: str = Field(..., min_length=3, max_length=50)
     start_date: datetime
     end_date: datetime
     capacity: int = Field(..., ge=1, description="Total story points capacity")
-    task_ids: List[str] = Field(..., min_items=1)
-    goals: List[str] = Field(..., min_items=1)
+    task_ids: List[str] = Field(..., min_length=1)
+    goals: List[str] = Field(..., min_length=1)
 
 
 class TaskDependency(BaseModel):
-    from_task: str = Field(..., pattern=r"^TASK-\d{3}$")
-    to_task: str = Field(..., pattern=r"^TASK-\d{3}$")
+    from_task: TaskId
+    to_task: TaskId
     type: str = Field(..., description="finish_to_start|start_to_start")
     description: str = Field(..., min_length=10)
 
@@ -644,18 +931,44 @@ class TasksData(BaseModel):
     methodology: str = Field(default="agile", description="agile|scrum|kanban")
     sprint_duration: str = Field(default="2 weeks")
     team_capacity: int = Field(..., ge=1)
-    epics: List[Epic] = Field(..., min_items=1)
-    tasks: List[Task] = Field(..., min_items=1)
-    sprints: List[Sprint] = Field(..., min_items=1)
+    epics: List[Epic] = Field(..., min_length=1)
+    tasks: List[Task] = Field(..., min_length=1)
+    sprints: List[Sprint] = Field(..., min_length=1)
     dependencies: List[TaskDependency] = Field(default_factory=list)
 
-
-class TasksModel(BaseModel):
+    def to_columns(self) -> Dict[str, list]:
+        """Columnar (struct-of-arrays) view of tasks for bulk analytics.
+
+        Downstream phases filter tasks by priority and total up story
+        points or estimated hours; iterating the model list touches one
+        instance __dict__ per row. This builds parallel per-field columns
+        in a single pass so aggregations and histograms scan homogeneous
+        lists instead. Plain lists are used - the pipeline has no numpy
+        dependency. The Pydantic representation stays the validation
+        ingress; this is a read-only projection.
+        """
+        columns = {
+            "id": [], "type": [], "priority": [], "story_points": [],
+            "estimated_hours": [], "assignee": [], "epic_id": [],
+        }
+        for task in self.tasks:
+            columns["id"].append(task.id)
+            columns["type"].append(task.type)
+            columns["priority"].append(task.priority)
+            columns["story_points"].append(task.story_points)
+            columns["estimated_hours"].append(task.estimated_hours)
+            columns["assignee"].append(task.assignee)
+            columns["epic_id"].append(task.epic_id)
+        return columns
+
+
+class TasksModel(TrustedLoadMixin, BaseModel):
+    model_config = ARTIFACT_MODEL_CONFIG
     artifact_type: str = Field(default="tasks")
     status: str = Field(default="complete")
     validation: ValidationStatus
     approval_required: bool = Field(default=True)
-    approvers: List[str] = Field(default=["Cynthia", "Hermann", "Usama"])
+    approvers: Tuple[str, ...] = Field(default=_TASKS_APPROVERS)
     next_phase: str = Field(default="adr_documentation")
     data: TasksData
 
@@ -665,49 +978,58 @@ class TasksModel(BaseModel):
 # ============================================================================
 
 class Alternative(BaseModel):
+    model_config = LEAF_MODEL_CONFIG
     option: str = Field(..., min_length=3, max_length=100)
-    pros: List[str] = Field(..., min_items=1)
-    cons: List[str] = Field(..., min_items=1)
+    pros: List[str] = Field(..., min_length=1)
+    cons: List[str] = Field(..., min_length=1)
     cost_estimate: Optional[str] = None
 
 
 class DecisionContext(BaseModel):
     description: str = Field(..., min_length=10)
-    requirements: List[str] = Field(..., min_items=1)
+    requirements: List[str] = Field(..., min_length=1)
     constraints: List[str] = Field(default_factory=list)
 
 
 class DecisionConsequences(BaseModel):
-    positive: List[str] = Field(..., min_items=1)
+    positive: List[str] = Field(..., min_length=1)
     negative: List[str] = Field(default_factory=list)
     risks: List[str] = Field(default_factory=list)
 
 
 class ArtifactReferences(BaseModel):
-    features: List[str] = Field(default_factory=list)
-    entities: List[str] = Field(default_factory=list)
-    tasks: List[str] = Field(default_factory=list)
+    model_config = LEAF_MODEL_CONFIG
+    features: Tuple[str, ...] = ()
+    entities: Tuple[str, ...] = ()
+    tasks: Tuple[str, ...] = ()
+
+
+# Shared empty-reference singleton: decisions without cross-references
+# reuse one frozen instance instead of constructing a fresh model (and
+# three empty lists) per Decision.
+_EMPTY_REFS = ArtifactReferences()
 
 
 class Decision(BaseModel):
-    id: str = Field(..., pattern=r"^ADR-\d{4}$", description="ADR ID format: ADR-0001")
+    id: AdrId = Field(..., description="ADR ID format: ADR-0001")
     title: str = Field(..., min_length=5, max_length=100)
-    status: ADRStatus
+    status: ADRStatusValue
     date: datetime
     author: str = Field(..., min_length=3)
     context: DecisionContext
     decision: str = Field(..., min_length=10)
-    alternatives: List[Alternative] = Field(..., min_items=2)
+    alternatives: List[Alternative] = Field(..., min_length=2)
     rationale: str = Field(..., min_length=20)
     consequences: DecisionConsequences
     related_decisions: List[str] = Field(default_factory=list)
-    superseded_by: Optional[str] = Field(None, pattern=r"^ADR-\d{4}$")
-    artifact_references: ArtifactReferences = Field(default_factory=ArtifactReferences)
+    superseded_by: Optional[AdrId] = None
+    artifact_references: ArtifactReferences = Field(default=_EMPTY_REFS)
 
 
 class DecisionMetadata(BaseModel):
     """Metadata for decisions when using markdown format."""
-    id: str = Field(..., pattern=r"^ADR-\d{4}$")
+    model_config = LEAF_MODEL_CONFIG
+    id: AdrId
     title: str = Field(..., min_length=5)
     status: str
     anchor_id: str
@@ -716,7 +1038,8 @@ class DecisionMetadata(BaseModel):
 
 class IndexEntry(BaseModel):
     """Index entry for markdown ADR format."""
-    id: str = Field(..., pattern=r"^ADR-\d{4}$")
+    model_config = LEAF_MODEL_CONFIG
+    id: AdrId
     title: str
     date: str
     status: str
@@ -730,7 +1053,7 @@ class ADRData(BaseModel):
     created_at: Optional[datetime] = None
 
     # Structured JSON format (project ADRs)
-    decisions: Optional[List[Decision]] = Field(None, min_items=1)
+    decisions: Optional[List[Decision]] = Field(None, min_length=1)
 
     # Markdown format (mothership ADRs)
     adr_file_content: Optional[str] = Field(None, min_length=10)
@@ -738,24 +1061,22 @@ class ADRData(BaseModel):
     decisions_added: Optional[List[DecisionMetadata]] = None
     index_entries: Optional[List[IndexEntry]] = None
 
-    @field_validator('decisions', 'adr_file_content', mode='after')
-    def validate_at_least_one_format(cls, v, info):
+    @model_validator(mode='after')
+    def validate_at_least_one_format(self):
         """Ensure at least one of decisions or adr_file_content is provided."""
-        if info.field_name == 'adr_file_content':
-            # Check if we're validating the last field
-            data = info.data
-            if not data.get('decisions') and not v:
-                raise ValueError("Either 'decisions' or 'adr_file_content' must be provided")
-        return v
+        if not self.decisions and not self.adr_file_content:
+            raise ValueError("Either 'decisions' or 'adr_file_content' must be provided")
+        return self
 
 
-class ADRModel(BaseModel):
+class ADRModel(TrustedLoadMixin, BaseModel):
+    model_config = ARTIFACT_MODEL_CONFIG
     artifact_type: str = Field(default="adr")
-    scope: Optional[str] = Field(None, pattern=r"^(mothership|project)$", description="Scope: mothership (read-only) or project (mutable)")
+    scope: Optional[Literal["mothership", "project"]] = Field(None, description="Scope: mothership (read-only) or project (mutable)")
     status: str = Field(default="complete")
     validation: ValidationStatus
     approval_required: bool = Field(default=True)
-    approvers: List[str] = Field(default=["Hermann", "Usama"])
+    approvers: Tuple[str, ...] = Field(default=_ADR_APPROVERS)
     next_phase: str = Field(default="scaffolding")
     data: ADRData
 
@@ -772,15 +1093,16 @@ class TemplateVariables(BaseModel):
 
 
 class TemplateApplication(BaseModel):
-    id: str = Field(..., pattern=r"^SCAFFOLD-\d{3}$", description="Scaffold ID format: SCAFFOLD-001")
+    id: ScaffoldId = Field(..., description="Scaffold ID format: SCAFFOLD-001")
     name: str = Field(..., min_length=5, max_length=100)
     source_path: str = Field(..., min_length=5)
     target_path: str = Field(..., min_length=1)
     variables: TemplateVariables
-    files_to_generate: List[str] = Field(..., min_items=1)
+    files_to_generate: List[str] = Field(..., min_length=1)
 
 
 class EnvironmentVariable(BaseModel):
+    model_config = LEAF_MODEL_CONFIG
     name: str = Field(..., min_length=1)
     description: str = Field(..., min_length=10)
     example: str = Field(..., min_length=1)
@@ -791,9 +1113,9 @@ class FeatureSelections(BaseModel):
     Feature selections for scaffolding. Now supports extensible options
     for different project types (frontend, backend, full-stack).
     """
-    auth: str = Field(..., pattern=r"^(firebase|auth0|nextauth|jwt|api_key|clerk|custom|none)$")
-    db: str = Field(..., pattern=r"^(postgres|mysql|mongodb|supabase|firebase|redis|none)$")
-    storage: str = Field(..., pattern=r"^(s3|gcs|firebase|minio|local|none)$")
+    auth: Literal["firebase", "auth0", "nextauth", "jwt", "api_key", "clerk", "custom", "none"]
+    db: Literal["postgres", "mysql", "mongodb", "supabase", "firebase", "redis", "none"]
+    storage: Literal["s3", "gcs", "firebase", "minio", "local", "none"]
     realtime: bool = Field(default=False)
     ci: bool = Field(default=True)
     docs: bool = Field(default=True)
@@ -827,9 +1149,9 @@ class ScaffoldPlanData(BaseModel):
 
     # Feature selections (tech stack)
     feature_selections: FeatureSelections
-    templates_to_apply: List[TemplateApplication] = Field(..., min_items=1)
-    directory_structure: Dict[str, str] = Field(..., min_items=1)
-    dependencies: Dict[str, List[str]] = Field(..., min_items=1)
+    templates_to_apply: List[TemplateApplication] = Field(..., min_length=1)
+    directory_structure: Dict[str, str] = Field(..., min_length=1)
+    dependencies: Dict[str, List[str]] = Field(..., min_length=1)
     environment_variables: List[EnvironmentVariable] = Field(default_factory=list)
 
     # Child project injection configuration
@@ -850,16 +1172,32 @@ class ScaffoldPlanData(BaseModel):
         description="Inject glassmorphism UI components"
     )
 
-    next_steps: List[str] = Field(..., min_items=1)
+    next_steps: List[str] = Field(..., min_length=1)
     estimated_setup_time: str = Field(..., min_length=3)
 
+    def directory_entries(self) -> Tuple[Tuple[str, str], ...]:
+        """Return directory_structure as a flat tuple of (path, purpose) pairs.
+
+        Consumers that only iterate the plan (scaffold apply, reports) can
+        walk the pairs directly instead of hashing keys through the dict.
+        """
+        return tuple(self.directory_structure.items())
+
+    def dependency_entries(self) -> Tuple[Tuple[str, Tuple[str, ...]], ...]:
+        """Return dependencies as a flat tuple of (group, packages) pairs."""
+        return tuple(
+            (group, tuple(packages))
+            for group, packages in self.dependencies.items()
+        )
+
 
-class ScaffoldPlanModel(BaseModel):
+class ScaffoldPlanModel(TrustedLoadMixin, BaseModel):
+    model_config = ARTIFACT_MODEL_CONFIG
     artifact_type: str = Field(default="scaffold_plan")
     status: str = Field(default="complete")
     validation: ValidationStatus
     approval_required: bool = Field(default=True)
-    approvers: List[str] = Field(default=["Cynthia", "Usama"])
+    approvers: Tuple[str, ...] = Field(default=_SCAFFOLD_APPROVERS)
     next_phase: str = Field(default="scaffold_apply")
     data: ScaffoldPlanData
 
@@ -869,27 +1207,35 @@ class ScaffoldPlanModel(BaseModel):
 # ============================================================================
 
 class FileChange(BaseModel):
+    model_config = LEAF_MODEL_CONFIG
     path: str = Field(..., min_length=1)
-    action: str = Field(..., pattern=r"^(created|modified|deleted)$")
+    action: Literal["created", "modified", "deleted"]
     lines_added: int = Field(default=0, ge=0)
     lines_removed: int = Field(default=0, ge=0)
     description: str = Field(..., min_length=10)
 
+    def to_dto(self) -> "FileChangeDTO":
+        """Return a read-only slotted mirror for reporting consumers."""
+        return FileChangeDTO(**self.__dict__)
+
 
 class TestResult(BaseModel):
+    model_config = LEAF_MODEL_CONFIG
     path: str = Field(..., min_length=1)
-    type: str = Field(..., pattern=r"^(unit|integration|e2e)$")
+    type: Literal["unit", "integration", "e2e"]
     test_count: int = Field(..., ge=1)
     coverage_percentage: Optional[int] = Field(None, ge=0, le=100)
 
 
 class AcceptanceCriteriaStatus(BaseModel):
+    model_config = LEAF_MODEL_CONFIG
     criteria: str = Field(..., min_length=5)
-    status: str = Field(..., pattern=r"^(satisfied|not_satisfied|partial)$")
+    status: Literal["satisfied", "not_satisfied", "partial"]
     evidence: str = Field(..., min_length=10)
 
 
 class DefinitionOfDoneItem(BaseModel):
+    model_config = LEAF_MODEL_CONFIG
     item: str = Field(..., min_length=5)
     completed: bool
     notes: Optional[str] = None
@@ -898,54 +1244,66 @@ class DefinitionOfDoneItem(BaseModel):
 class TechnicalDecision(BaseModel):
     decision: str = Field(..., min_length=10)
     rationale: str = Field(..., min_length=20)
-    adr_reference: Optional[str] = Field(None, pattern=r"^ADR-\d{4}$")
+    adr_reference: Optional[AdrId] = None
 
 
 class DependencyVerification(BaseModel):
-    task_id: str = Field(..., pattern=r"^TASK-\d{3}$")
-    status: str = Field(..., pattern=r"^(completed|blocked|in_progress)$")
+    model_config = LEAF_MODEL_CONFIG
+    task_id: TaskId
+    status: Literal["completed", "blocked", "in_progress"]
     verified_at: datetime
 
 
 class TestSummary(BaseModel):
+    model_config = LEAF_MODEL_CONFIG
     total: int = Field(..., ge=0)
     passed: int = Field(..., ge=0)
     failed: int = Field(..., ge=0)
     coverage: Optional[int] = Field(None, ge=0, le=100)
 
 
+class LintingResult(BaseModel):
+    model_config = LEAF_MODEL_CONFIG
+    errors: int = Field(default=0, ge=0)
+    warnings: int = Field(default=0, ge=0)
+    passed: bool = True
+
+
 class TestResults(BaseModel):
     unit_tests: TestSummary
     integration_tests: TestSummary
-    linting: Dict[str, Any] = Field(default_factory=dict)
+    linting: LintingResult = Field(default_factory=LintingResult)
 
 
 class PerformanceMetrics(BaseModel):
+    model_config = LEAF_MODEL_CONFIG
     response_time_ms: Optional[int] = Field(None, ge=0)
     memory_usage_mb: Optional[int] = Field(None, ge=0)
     cpu_usage_percent: Optional[int] = Field(None, ge=0, le=100)
 
 
 class SecurityChecklistItem(BaseModel):
+    model_config = LEAF_MODEL_CONFIG
     item: str = Field(..., min_length=5)
-    status: str = Field(..., pattern=r"^(completed|not_applicable|pending)$")
+    status: Literal["completed", "not_applicable", "pending"]
     details: Optional[str] = None
 
 
 class DocumentationUpdate(BaseModel):
+    model_config = LEAF_MODEL_CONFIG
     file: str = Field(..., min_length=1)
     description: str = Field(..., min_length=10)
 
 
 class ImplementationData(BaseModel):
-    task_id: str = Field(..., pattern=r"^TASK-\d{3}$")
+    task_id: TaskId
     title: str = Field(..., min_length=5, max_length=100)
     implementation_date: datetime
     developer: str = Field(..., min_length=3)
-    files_changed: List[FileChange] = Field(..., min_items=1)
+    files_changed: List[FileChange] = Field(..., min_length=1)
     tests_added: List[TestResult] = Field(default_factory=list)
-    acceptance_criteria_status: List[AcceptanceCriteriaStatus] = Field(..., min_items=1)
-    definition_of_done_checklist: List[DefinitionOfDoneItem] = Field(..., min_items=1)
+    acceptance_criteria_status: List[AcceptanceCriteriaStatus] = Field(..., min_length=1)
+    definition_of_done_checklist: List[DefinitionOfDoneItem] = Field(..., min_length=1)
     technical_decisions: List[TechnicalDecision] = Field(default_factory=list)
     dependencies_verified: List[DependencyVerification] = Field(default_factory=list)
     test_results: TestResults
@@ -956,12 +1314,13 @@ class ImplementationData(BaseModel):
     future_considerations: List[str] = Field(default_factory=list)
 
 
-class ImplementationModel(BaseModel):
+class ImplementationModel(TrustedLoadMixin, BaseModel):
+    model_config = ARTIFACT_MODEL_CONFIG
     artifact_type: str = Field(default="implementation")
     status: str = Field(default="complete")
     validation: ValidationStatus
     approval_required: bool = Field(default=True)
-    approvers: List[str] = Field(default=["Mustaffa", "Usama"])
+    approvers: Tuple[str, ...] = Field(default=_IMPL_APPROVERS)
     next_phase: str = Field(default="integration")
     data: ImplementationData
 
@@ -981,7 +1340,7 @@ class TaskProgressStatus(str, Enum):
 
 class TaskProgress(BaseModel):
     """Tracks the progress of a single task."""
-    task_id: str = Field(..., pattern=r"^TASK-\d{3}$")
+    task_id: TaskId
     status: TaskProgressStatus = Field(default=TaskProgressStatus.PENDING)
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
@@ -1016,7 +1375,7 @@ class WorkSession(BaseModel):
 
     # Progress tracking
     tasks_attempted: List[TaskProgress] = Field(default_factory=list)
-    current_task_id: Optional[str] = Field(None, pattern=r"^TASK-\d{3}$")
+    current_task_id: Optional[TaskId] = None
 
     # Summary stats (updated on completion/crash)
     tasks_completed: int = Field(default=0, ge=0)
@@ -1054,8 +1413,9 @@ class WorkLogData(BaseModel):
     total_commits: int = Field(default=0, ge=0)
 
 
-class WorkLogModel(BaseModel):
+class WorkLogModel(TrustedLoadMixin, BaseModel):
     """Artifact wrapper for work log."""
+    model_config = ARTIFACT_MODEL_CONFIG
     artifact_type: str = Field(default="work_log")
     status: str = Field(default="active")
     validation: ValidationStatus
@@ -1068,7 +1428,7 @@ class ChangelogEntry(BaseModel):
     date: datetime
     session_id: str = Field(..., description="Reference to work session")
     summary: str = Field(..., min_length=10)
-    changes: List[str] = Field(..., min_items=1, description="List of changes made")
+    changes: List[str] = Field(..., min_length=1, description="List of changes made")
     tasks_completed: List[str] = Field(default_factory=list, description="TASK-### IDs completed")
     breaking_changes: List[str] = Field(default_factory=list)
     contributors: List[str] = Field(default_factory=list)
@@ -1083,8 +1443,9 @@ class ChangelogData(BaseModel):
     entries: List[ChangelogEntry] = Field(default_factory=list)
 
 
-class ChangelogModel(BaseModel):
+class ChangelogModel(TrustedLoadMixin, BaseModel):
     """Artifact wrapper for changelog."""
+    model_config = ARTIFACT_MODEL_CONFIG
     artifact_type: str = Field(default="changelog")
     status: str = Field(default="active")
     data: ChangelogData
@@ -1094,8 +1455,69 @@ class ChangelogModel(BaseModel):
 # Error Models
 # ============================================================================
 
+class ErrorDetails(BaseModel):
+    """Structured error payload matching the agent error contract."""
+    model_config = LEAF_MODEL_CONFIG
+    code: str = Field(..., min_length=1)
+    message: str = Field(..., min_length=1)
+    details: List[str] = Field(default_factory=list)
+    artifact: Optional[str] = None
+    remediation: Optional[str] = None
+
+
 class ErrorModel(BaseModel):
-    error: Dict[str, Any] = Field(..., description="Error details")
+    error: ErrorDetails = Field(..., description="Error details")
+
+
+# ============================================================================
+# Read-only DTO mirrors
+# ============================================================================
+
+def _dto_mirror(model_cls, name: str):
+    """Build a frozen, slotted dataclass mirroring a model's fields.
+
+    Analytics and scheduling phases iterate thousands of already-validated
+    Task/Touchpoint/FileChange instances without ever re-validating them.
+    A slots dataclass drops the per-instance __dict__ and pydantic
+    bookkeeping, so read-only fan-out holds plain attribute records.
+    """
+    return dataclasses.make_dataclass(
+        name,
+        [(field_name, Any) for field_name in model_cls.model_fields],
+        frozen=True,
+        slots=True,
+    )
+
+
+TouchpointDTO = _dto_mirror(Touchpoint, 'TouchpointDTO')
+TaskDTO = _dto_mirror(Task, 'TaskDTO')
+FileChangeDTO = _dto_mirror(FileChange, 'FileChangeDTO')
+
+
+# ============================================================================
+# Artifact serialization helpers
+# ============================================================================
+
+def dump_artifact(model: BaseModel) -> bytes:
+    """Serialize an artifact model to JSON bytes.
+
+    orjson serializes the materialized dict in C, which is faster than
+    json.dumps for the nested artifact payloads every phase handoff writes.
+    """
+    import orjson
+
+    return orjson.dumps(model.model_dump(mode='json'))
+
+
+def load_artifact(cls, data: bytes):
+    """Deserialize JSON bytes into an artifact model.
+
+    model_validate_json parses inside pydantic-core, so read-back skips
+    the Python-level json.loads + dict re-walk of model_validate. For
+    trusted re-reads where validation can be skipped entirely, use
+    TrustedLoadMixin.from_trusted on the parsed payload instead.
+    """
+    return cls.model_validate_json(data)
 
 
 # ============================================================================
@@ -1103,6 +1525,15 @@ class ErrorModel(BaseModel):
 # ============================================================================
 
 __all__ = [
+    # Shared TypeAdapter cache and serialization helpers
+    'get_adapter', 'dump_artifact', 'load_artifact',
+
+    # Stable ID aliases and bulk ID scanner
+    'EntityId', 'RelationshipId', 'FeatureId', 'StoryId', 'StepId', 'FlowId',
+    'SystemFlowId', 'PersonaId', 'TouchpointId', 'PhaseId', 'JourneyId',
+    'OpportunityId', 'EpicId', 'TaskId', 'SprintId', 'AdrId', 'ScaffoldId',
+    'ID_SCANNER',
+
     # Domain Mapping (Propose-Validate-Confirm pattern)
     'DomainSchema', 'DomainMapping',
 
@@ -1124,6 +1555,9 @@ __all__ = [
     # Tasks
     'TasksModel', 'TasksData', 'Task', 'Epic', 'Sprint', 'TaskDependency', 'ContextPlan', 'TestingStrategy',
 
+    # Read-only DTO mirrors
+    'TaskDTO', 'TouchpointDTO', 'FileChangeDTO',
+
     # ADR
     'ADRModel', 'ADRData', 'Decision', 'DecisionMetadata', 'IndexEntry', 'Alternative', 'DecisionContext',
 
@@ -1139,7 +1573,7 @@ __all__ = [
     'TaskProgressStatus', 'WorkSessionStatus',
 
     # Error
-    'ErrorModel',
+    'ErrorModel', 'ErrorDetails',
 
     # Enums
     'PriorityLevel', 'TaskType', 'ADRStatus', 'ValidationStatus', 'EmotionalState', 'TouchpointType',
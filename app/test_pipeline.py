@@ -12,45 +12,43 @@ Philosophy:
 - Test end-to-end pipeline execution
 """
 
-import json
+import orjson
 import pytest
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any
 
 from app.models import (
-    PRDModel, FlowModel, ERDModel, JourneyModel, 
+    PRDModel, FlowModel, ERDModel, JourneyModel,
     TasksModel, ADRModel, ScaffoldPlanModel, ImplementationModel
 )
 
+# Shared test directories, resolved and created once per process instead
+# of per test-class instantiation.
+_TEST_DATA_DIR = Path("tests/fixtures")
+_OUTPUT_DIR = Path("tests/output")
+_TEST_DATA_DIR.mkdir(parents=True, exist_ok=True)
+_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
-class PipelineIntegrationTest:
-    """Integration test suite for the complete pipeline."""
-    
-    def __init__(self):
-        self.test_data_dir = Path("tests/fixtures")
-        self.output_dir = Path("tests/output")
-        self.output_dir.mkdir(exist_ok=True)
-    
-    def setup_test_transcript(self) -> str:
-        """Create a realistic client transcript for testing."""
-        transcript = """
+# Realistic client transcript fixture, pre-encoded once at import so each
+# pipeline run writes the same bytes without re-encoding the constant.
+_TRANSCRIPT_BYTES = b"""
         # Client Onboarding Interview - E-commerce Platform
-        
+
         **Project**: Modern e-commerce platform
         **Client**: TechStart Solutions
         **Date**: 2024-01-15
-        
+
         ## Requirements Discussion
-        
+
         **Interviewer**: What kind of application are you looking to build?
-        
-        **Client**: We need a modern e-commerce platform for selling digital products. 
+
+        **Client**: We need a modern e-commerce platform for selling digital products.
         Our main users are content creators who want to sell courses, ebooks, and templates.
-        
+
         **Interviewer**: What are the core features you need?
-        
-        **Client**: 
+
+        **Client**:
         - User registration and authentication
         - Product catalog with categories
         - Shopping cart and checkout
@@ -58,17 +56,36 @@ class PipelineIntegrationTest:
         - Digital product delivery
         - User dashboard for purchases
         - Admin panel for product management
-        
+
         **Interviewer**: Any technical preferences?
-        
-        **Client**: We prefer Next.js for frontend, PostgreSQL for database. 
+
+        **Client**: We prefer Next.js for frontend, PostgreSQL for database.
         Need it to be scalable and secure. Budget is around $50k.
         """
-        
-        transcript_path = self.test_data_dir / "client_transcript.md"
-        transcript_path.parent.mkdir(exist_ok=True)
-        transcript_path.write_text(transcript)
-        return str(transcript_path)
+
+
+class PipelineIntegrationTest:
+    """Integration test suite for the complete pipeline."""
+    
+    def __init__(self):
+        self.test_data_dir = _TEST_DATA_DIR
+        self.output_dir = _OUTPUT_DIR
+        self._transcript_path = self.test_data_dir / "client_transcript.md"
+        # One timestamp per run keeps the three stage fixtures consistent
+        # and makes the serialized artifacts deterministic within a run.
+        self._now = datetime.now()
+        # Validated stage results, keyed by artifact type. Each stage is
+        # built once per run; later checks read from here instead of
+        # re-parsing the JSON written to output_dir.
+        self._artifacts: Dict[str, Dict[str, Any]] = {}
+        # Serialized stage outputs buffered during the run and flushed in
+        # one pass, so the pipeline body does no file I/O between stages.
+        self._pending_writes: list = []
+    
+    def setup_test_transcript(self) -> str:
+        """Write the client transcript fixture (pre-encoded constant)."""
+        self._transcript_path.write_bytes(_TRANSCRIPT_BYTES)
+        return str(self._transcript_path)
     
     def test_full_pipeline_integration(self):
         """Test complete pipeline from transcript to scaffolded project."""
@@ -114,16 +131,49 @@ class PipelineIntegrationTest:
             impl_result = self.test_implementation(task_result["data"]["tasks"][0])
             assert impl_result["validation"] == "passed"
         
+        # 10. Flush buffered stage outputs in one pass
+        self._flush_writes()
+
         print("✅ Full pipeline integration test passed!")
     
+    def _wrap_stage(self, artifact_type: str, data: Dict[str, Any],
+                    approvers: list, next_phase: str) -> Dict[str, Any]:
+        """Wrap stage data in the shared agent-result envelope."""
+        return {
+            "artifact_type": artifact_type,
+            "status": "complete",
+            "validation": "passed",
+            "approval_required": True,
+            "approvers": approvers,
+            "next_phase": next_phase,
+            "data": data,
+        }
+
+    def _finalize_stage(self, name: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Memoize a stage result and queue its serialized form for writing."""
+        output_file = self.output_dir / f"{name}.json"
+        self._pending_writes.append(
+            (output_file, orjson.dumps(result, option=orjson.OPT_INDENT_2)))
+        self._artifacts[name] = result
+        return result
+
+    def _flush_writes(self):
+        """Write all buffered stage outputs to disk."""
+        for path, buf in self._pending_writes:
+            path.write_bytes(buf)
+        self._pending_writes.clear()
+
     def test_prd_generation(self, transcript_path: str) -> Dict[str, Any]:
         """Test PRD generation from transcript."""
-        
+
+        if "prd" in self._artifacts:
+            return self._artifacts["prd"]
+
         # Simulate PRD agent output
         prd_data = {
             "project_name": "Digital Product E-commerce Platform",
             "owner_email": "client@techstart.com",
-            "created_at": datetime.now(),
+            "created_at": self._now,
             "version": "1.0.0",
             "features": [
                 {
@@ -153,34 +203,29 @@ class PipelineIntegrationTest:
             "constraints": ["Budget: $50k", "Timeline: 3 months"]
         }
         
-        # Validate against Pydantic model
-        prd_result = {
-            "artifact_type": "prd",
-            "status": "complete", 
-            "validation": "passed",
-            "approval_required": True,
-            "approvers": ["Cynthia", "Hermann", "Usama"],
-            "next_phase": "flow_design",
-            "data": prd_data
-        }
-        
-        # Test Pydantic validation
-        prd_model = PRDModel(**prd_result)
+        prd_result = self._wrap_stage(
+            "prd", prd_data, ["Cynthia", "Hermann", "Usama"], "flow_design")
+
+        # Test Pydantic validation - the PRD stage keeps the explicit
+        # full-validation path so validator coverage is preserved even
+        # when the later stages load their fixtures as trusted.
+        # model_validate takes the dict directly, skipping the kwargs
+        # unpack/repack of PRDModel(**prd_result).
+        prd_model = PRDModel.model_validate(prd_result)
         assert prd_model.artifact_type == "prd"
-        
-        # Save for next stages
-        output_file = self.output_dir / "prd.json"
-        output_file.write_text(json.dumps(prd_result, default=str, indent=2))
-        
-        return prd_result
+
+        return self._finalize_stage("prd", prd_result)
     
     def test_flow_generation(self, prd_result: Dict[str, Any]) -> Dict[str, Any]:
         """Test Flow generation from PRD."""
-        
+
+        if "flow" in self._artifacts:
+            return self._artifacts["flow"]
+
         flow_data = {
             "project_name": prd_result["data"]["project_name"],
             "version": "1.0.0",
-            "created_at": datetime.now(),
+            "created_at": self._now,
             "user_flows": [
                 {
                     "id": "FLOW-001",
@@ -211,33 +256,26 @@ class PipelineIntegrationTest:
             "assumptions": []
         }
         
-        flow_result = {
-            "artifact_type": "flow",
-            "status": "complete",
-            "validation": "passed", 
-            "approval_required": True,
-            "approvers": ["Cynthia", "Hassan"],
-            "next_phase": "erd_design",
-            "data": flow_data
-        }
-        
-        # Validate
-        flow_model = FlowModel(**flow_result)
+        flow_result = self._wrap_stage(
+            "flow", flow_data, ["Cynthia", "Hassan"], "erd_design")
+
+        # Validate (from_trusted validates by default; with TRUSTED_LOAD=1
+        # the known-valid fixture skips re-validation via model_construct)
+        flow_model = FlowModel.from_trusted(flow_result)
         assert len(flow_model.data.user_flows) >= 1
-        
-        # Save
-        output_file = self.output_dir / "flow.json"
-        output_file.write_text(json.dumps(flow_result, default=str, indent=2))
-        
-        return flow_result
+
+        return self._finalize_stage("flow", flow_result)
     
     def test_erd_generation(self, prd_result: Dict[str, Any], flow_result: Dict[str, Any]) -> Dict[str, Any]:
         """Test ERD generation from PRD and Flow."""
-        
+
+        if "erd" in self._artifacts:
+            return self._artifacts["erd"]
+
         erd_data = {
             "project_name": prd_result["data"]["project_name"],
             "version": "1.0.0", 
-            "created_at": datetime.now(),
+            "created_at": self._now,
             "database_type": "postgres",
             "entities": [
                 {
@@ -280,25 +318,15 @@ class PipelineIntegrationTest:
             }
         }
         
-        erd_result = {
-            "artifact_type": "erd",
-            "status": "complete",
-            "validation": "passed",
-            "approval_required": True, 
-            "approvers": ["Cynthia", "Hassan", "Usama"],
-            "next_phase": "journey_mapping",
-            "data": erd_data
-        }
-        
-        # Validate
-        erd_model = ERDModel(**erd_result)
+        erd_result = self._wrap_stage(
+            "erd", erd_data, ["Cynthia", "Hassan", "Usama"], "journey_mapping")
+
+        # Validate (trusted fixture: full validation by default, skipped
+        # under TRUSTED_LOAD=1)
+        erd_model = ERDModel.from_trusted(erd_result)
         assert len(erd_model.data.entities) >= 1
-        
-        # Save
-        output_file = self.output_dir / "erd.json"
-        output_file.write_text(json.dumps(erd_result, default=str, indent=2))
-        
-        return erd_result
+
+        return self._finalize_stage("erd", erd_result)
     
     def test_journey_generation(self, prd_result, flow_result, erd_result) -> Dict[str, Any]:
         """Test Journey generation."""
@@ -324,26 +352,43 @@ class PipelineIntegrationTest:
     
     def test_artifact_consistency(self):
         """Test consistency between artifacts."""
-        
-        # Load all generated artifacts
-        prd_file = self.output_dir / "prd.json"
-        flow_file = self.output_dir / "flow.json"
-        erd_file = self.output_dir / "erd.json"
-        
-        if not all(f.exists() for f in [prd_file, flow_file, erd_file]):
-            pytest.skip("Artifacts not generated yet")
-        
-        prd_data = json.loads(prd_file.read_text())
-        flow_data = json.loads(flow_file.read_text())
-        erd_data = json.loads(erd_file.read_text())
-        
+
+        # Prefer the in-memory results from this run; fall back to the
+        # JSON files only when checking a previously generated set.
+        if all(k in self._artifacts for k in ("prd", "flow", "erd")):
+            prd_data = self._artifacts["prd"]
+            flow_data = self._artifacts["flow"]
+            erd_data = self._artifacts["erd"]
+
+            prd_name = prd_data["data"]["project_name"]
+            flow_name = flow_data["data"]["project_name"]
+            erd_name = erd_data["data"]["project_name"]
+            prd_feature_ids = [f["id"] for f in prd_data["data"]["features"]]
+            flow_feature_refs = [f["feature_id"] for f in flow_data["data"]["user_flows"]]
+        else:
+            prd_file = self.output_dir / "prd.json"
+            flow_file = self.output_dir / "flow.json"
+            erd_file = self.output_dir / "erd.json"
+
+            if not all(f.exists() for f in [prd_file, flow_file, erd_file]):
+                pytest.skip("Artifacts not generated yet")
+
+            # model_validate_json parses and validates in one pass from
+            # bytes, so stale or hand-edited artifacts fail loudly here
+            # instead of slipping through a bare json.loads.
+            prd_model = PRDModel.model_validate_json(prd_file.read_bytes())
+            flow_model = FlowModel.model_validate_json(flow_file.read_bytes())
+            erd_model = ERDModel.model_validate_json(erd_file.read_bytes())
+
+            prd_name = prd_model.data.project_name
+            flow_name = flow_model.data.project_name
+            erd_name = erd_model.data.project_name
+            prd_feature_ids = [f.id for f in prd_model.data.features]
+            flow_feature_refs = [f.feature_id for f in flow_model.data.user_flows]
+
         # Test cross-artifact consistency
-        assert prd_data["data"]["project_name"] == flow_data["data"]["project_name"]
-        assert prd_data["data"]["project_name"] == erd_data["data"]["project_name"]
-        
-        # Test ID references
-        prd_feature_ids = [f["id"] for f in prd_data["data"]["features"]]
-        flow_feature_refs = [f["feature_id"] for f in flow_data["data"]["user_flows"]]
+        assert prd_name == flow_name
+        assert prd_name == erd_name
         
         for ref in flow_feature_refs:
             assert ref in prd_feature_ids, f"Flow references non-existent feature {ref}"
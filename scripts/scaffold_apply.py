@@ -17,11 +17,16 @@ Pydantic models defined in app.models.
 """
 
 import argparse
+import functools
 import json
 import os
 import re
+import shutil
 import stat
 import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import orjson
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -29,39 +34,64 @@ from typing import Any, Dict, List, Optional, Tuple
 from pydantic import ValidationError
 
 try:
-    from app.models import ScaffoldPlanModel, PRDModel, ERDModel, ErrorModel
+    from app.models import ScaffoldPlanModel, PRDModel, ERDModel, ErrorModel, get_adapter
 except Exception:
     sys.path.append(str(Path(__file__).resolve().parents[1]))
-    from app.models import ScaffoldPlanModel, PRDModel, ERDModel, ErrorModel
+    from app.models import ScaffoldPlanModel, PRDModel, ERDModel, ErrorModel, get_adapter
 
 
 REQUIRED_APPROVERS = {"Cynthia", "Usama"}
+
+# Static post-apply guidance emitted with every result; built once at
+# import instead of per invocation.
+SETUP_INSTRUCTIONS = (
+    "Run 'npm install' to install dependencies",
+    "Run 'npx husky install' to set up git hooks",
+    "Copy .env.example to .env and fill in values",
+    "Run 'npm run db:generate' to generate Prisma client",
+    "Run 'npm run dev' to start development server",
+)
+
 TEMPLATES_DIR = Path(__file__).resolve().parents[1] / "templates" / "child-project"
 
+# Slug character mapping: one translate pass instead of chained replaces.
+_SLUG_TRANS = str.maketrans({" ": "-", "_": "-"})
+
 
 def load_json(path: Path) -> Dict[str, Any]:
-    return json.loads(path.read_text())
+    # orjson parses straight from bytes, skipping the text decode and the
+    # pure-Python parse of json.loads(path.read_text()) on large artifacts.
+    return orjson.loads(path.read_bytes())
+
 
+def validate_inputs(prd_path: Path, erd_path: Path, plan_path: Path,
+                    trust_inputs: bool = False) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+    """Load and validate the three input artifacts.
 
-def validate_inputs(prd_path: Path, erd_path: Path, plan_path: Path) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+    With ``trust_inputs`` the full Pydantic validation is skipped; only the
+    cross-artifact consistency check runs. This is safe only for artifacts
+    that already passed ``app.lint_prd`` / ``app.lint_erd`` (e.g. a CI step
+    that lints first and scaffolds second).
+    """
     prd = load_json(prd_path)
     erd = load_json(erd_path)
     plan = load_json(plan_path)
 
-    try:
-        PRDModel(**prd)
-    except ValidationError as e:
-        raise ValueError(f"PRD validation failed: {e}")
+    if not trust_inputs:
+        try:
+            get_adapter(PRDModel).validate_python(prd)
+        except ValidationError as e:
+            raise ValueError(f"PRD validation failed: {e}")
 
-    try:
-        ERDModel(**erd)
-    except ValidationError as e:
-        raise ValueError(f"ERD validation failed: {e}")
+        try:
+            get_adapter(ERDModel).validate_python(erd)
+        except ValidationError as e:
+            raise ValueError(f"ERD validation failed: {e}")
 
-    try:
-        ScaffoldPlanModel(**plan)
-    except ValidationError as e:
-        raise ValueError(f"Scaffold plan validation failed: {e}")
+        try:
+            get_adapter(ScaffoldPlanModel).validate_python(plan)
+        except ValidationError as e:
+            raise ValueError(f"Scaffold plan validation failed: {e}")
 
     prj_prd = prd.get("data", {}).get("project_name")
     prj_erd = erd.get("data", {}).get("project_name")
@@ -79,8 +109,36 @@ def require_approval(provided_approvers: List[str]) -> None:
         raise PermissionError(f"Missing required approvers: {', '.join(sorted(missing))}")
 
 
+# Directories already created this run. Template injectors, domain
+# structure and placeholder writes all funnel through ensure_directory
+# and mostly hit the same handful of parents, so repeat calls skip the
+# mkdir (and its stat walk) entirely.
+_created_dirs: set = set()
+
+
 def ensure_directory(path: Path) -> None:
+    if path in _created_dirs:
+        return
     path.mkdir(parents=True, exist_ok=True)
+    _created_dirs.add(path)
+
+
+def safe_join(project_root: Path, rel_path: str) -> Path:
+    """Join a plan-relative path onto the resolved project root.
+
+    The root is already absolute, so no per-file resolve() (and its
+    lstat walk) is needed; plans that try to escape the root — via ".."
+    segments, an absolute path (which would make the join discard the
+    root entirely), or backslash separators hiding a ".." — are
+    rejected outright.
+    """
+    if (
+        "\\" in rel_path
+        or ".." in rel_path.split("/")
+        or Path(rel_path).is_absolute()
+    ):
+        raise ValueError(f"Path escapes project root: {rel_path}")
+    return project_root / rel_path
 
 
 def build_template_variables(plan: Dict[str, Any], prd: Dict[str, Any], erd: Dict[str, Any]) -> Dict[str, Any]:
@@ -90,7 +148,7 @@ def build_template_variables(plan: Dict[str, Any], prd: Dict[str, Any], erd: Dic
     erd_data = erd.get("data", {})
 
     project_name = data.get("project_name", "Project")
-    project_slug = project_name.lower().replace(" ", "-").replace("_", "-")
+    project_slug = project_name.lower().translate(_SLUG_TRANS)
 
     # Extract design brief
     design_brief = data.get("design_brief", {})
@@ -105,30 +163,38 @@ def build_template_variables(plan: Dict[str, Any], prd: Dict[str, Any], erd: Dic
     # Extract feature selections
     features = data.get("feature_selections", {})
 
+    # Bind repeated lookups once: a single timestamp for both generated
+    # forms, and locals for the keys read several times below.
+    now = datetime.now(timezone.utc)
+    accent = colors.get("accent") or []
+    bp = design_brief.get("responsive_breakpoints") or {}
+    preset = design_brief.get("preset")
+    component_style = design_brief.get("component_style")
+
     # Build variables dict
     variables = {
         # Project identity
         "PROJECT_NAME": project_name,
         "PROJECT_SLUG": project_slug,
         "VERSION": data.get("version", "1.0.0"),
-        "CREATED_AT": datetime.now(timezone.utc).isoformat(),
-        "GENERATED_AT": datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC"),
+        "CREATED_AT": now.isoformat(),
+        "GENERATED_AT": now.strftime("%Y-%m-%d %H:%M:%S UTC"),
 
         # Architecture
         "ARCHITECTURE_STYLE": data.get("architecture_style", "modular_monolith"),
 
         # Design preset
         "DESIGN_PRESET": design_brief.get("preset", "corporate"),
-        "PRESET_CREATIVE": design_brief.get("preset") == "creative",
-        "PRESET_CORPORATE": design_brief.get("preset") == "corporate",
-        "PRESET_NEUTRAL": design_brief.get("preset") == "neutral",
-        "PRESET_CUSTOM": design_brief.get("preset") == "custom",
+        "PRESET_CREATIVE": preset == "creative",
+        "PRESET_CORPORATE": preset == "corporate",
+        "PRESET_NEUTRAL": preset == "neutral",
+        "PRESET_CUSTOM": preset == "custom",
 
         # Colors
         "PRIMARY_COLOR": colors.get("primary", "#14b8a6"),
         "SECONDARY_COLOR": colors.get("secondary", "#0d9488"),
-        "ACCENT_COLOR_1": colors.get("accent", ["#0891b2"])[0] if colors.get("accent") else "#0891b2",
-        "ACCENT_COLOR_2": colors.get("accent", ["#0891b2", "#0891b2"])[1] if len(colors.get("accent", [])) > 1 else "#0891b2",
+        "ACCENT_COLOR_1": accent[0] if accent else "#0891b2",
+        "ACCENT_COLOR_2": accent[1] if len(accent) > 1 else "#0891b2",
         "BACKGROUND_COLOR": colors.get("background", "#ffffff"),
         "SURFACE_COLOR": colors.get("surface", "#f0fdfa"),
         "TEXT_PRIMARY": colors.get("text_primary", "#134e4a"),
@@ -152,17 +218,17 @@ def build_template_variables(plan: Dict[str, Any], prd: Dict[str, Any], erd: Dic
         "FONT_SCALE_RATIO": typography.get("scale_ratio", 1.25),
 
         # Breakpoints
-        "BREAKPOINT_SM": design_brief.get("responsive_breakpoints", {}).get("sm", "640px"),
-        "BREAKPOINT_MD": design_brief.get("responsive_breakpoints", {}).get("md", "768px"),
-        "BREAKPOINT_LG": design_brief.get("responsive_breakpoints", {}).get("lg", "1024px"),
-        "BREAKPOINT_XL": design_brief.get("responsive_breakpoints", {}).get("xl", "1280px"),
-        "BREAKPOINT_2XL": design_brief.get("responsive_breakpoints", {}).get("2xl", "1536px"),
+        "BREAKPOINT_SM": bp.get("sm", "640px"),
+        "BREAKPOINT_MD": bp.get("md", "768px"),
+        "BREAKPOINT_LG": bp.get("lg", "1024px"),
+        "BREAKPOINT_XL": bp.get("xl", "1280px"),
+        "BREAKPOINT_2XL": bp.get("2xl", "1536px"),
 
         # Component style
         "COMPONENT_STYLE": design_brief.get("component_style", "rounded"),
-        "STYLE_ROUNDED": design_brief.get("component_style") == "rounded",
-        "STYLE_SHARP": design_brief.get("component_style") == "sharp",
-        "STYLE_PILL": design_brief.get("component_style") == "pill",
+        "STYLE_ROUNDED": component_style == "rounded",
+        "STYLE_SHARP": component_style == "sharp",
+        "STYLE_PILL": component_style == "pill",
 
         # Dark mode
         "DARK_MODE_ENABLED": design_brief.get("dark_mode_support", True),
@@ -181,9 +247,22 @@ def build_template_variables(plan: Dict[str, Any], prd: Dict[str, Any], erd: Dic
     return variables
 
 
+# Template substitution patterns, compiled once at import instead of per
+# template file.
+_VAR_RE = re.compile(r"\{\{([A-Z_0-9]+)\}\}")
+_IF_RE = re.compile(r"\{\{#if\s+([A-Z_0-9]+)\}\}(.*?)\{\{/if\}\}", re.DOTALL)
+_EACH_DOMAINS_RE = re.compile(r"\{\{#each domains\}\}(.*?)\{\{/each\}\}", re.DOTALL)
+_EACH_TOKEN_RE = re.compile(r"\{\{(name|description|root_entity|entities|dependencies|features)\}\}")
+
+
 def substitute_variables(content: str, variables: Dict[str, Any]) -> str:
     """Replace {{VARIABLE}} placeholders with actual values."""
 
+    # Literal fast path: templates without any marker skip all three
+    # regex passes (a plain substring scan is far cheaper than re.search).
+    if "{{" not in content:
+        return content
+
     def replace_var(match):
         var_name = match.group(1)
         value = variables.get(var_name, match.group(0))
@@ -194,47 +273,52 @@ def substitute_variables(content: str, variables: Dict[str, Any]) -> str:
         return str(value) if value is not None else ""
 
     # Replace simple {{VARIABLE}} patterns
-    content = re.sub(r"\{\{([A-Z_0-9]+)\}\}", replace_var, content)
+    content = _VAR_RE.sub(replace_var, content)
 
-    # Handle conditional blocks: {{#if VAR}}...{{/if}}
+    # Handle conditional blocks: {{#if VAR}}...{{/if}}. The non-greedy
+    # pattern can't match nested blocks anyway, so a single sub pass
+    # handles every non-overlapping block without re-scanning the text.
     def process_conditionals(text: str) -> str:
-        pattern = r"\{\{#if\s+([A-Z_0-9]+)\}\}(.*?)\{\{/if\}\}"
-        while re.search(pattern, text, re.DOTALL):
-            def replace_conditional(m):
-                var_name = m.group(1)
-                inner_content = m.group(2)
-                var_value = variables.get(var_name, False)
-                if var_value:
-                    return inner_content
-                return ""
-            text = re.sub(pattern, replace_conditional, text, flags=re.DOTALL)
-        return text
-
-    content = process_conditionals(content)
+        def replace_conditional(m):
+            if variables.get(m.group(1), False):
+                return m.group(2)
+            return ""
+
+        return _IF_RE.sub(replace_conditional, text)
+
+    if "{{#if" in content:
+        content = process_conditionals(content)
 
     # Handle {{#each domains}}...{{/each}} blocks
     def process_each_domains(text: str) -> str:
-        pattern = r"\{\{#each domains\}\}(.*?)\{\{/each\}\}"
-        domains = variables.get("domains", [])
+        # Render each domain's token values once; every {{#each}} block in
+        # the file then reuses them instead of re-joining the entity,
+        # dependency and feature lists per block.
+        rendered = [
+            {
+                "name": domain.get("name", ""),
+                "description": domain.get("description", ""),
+                "root_entity": domain.get("root_entity", ""),
+                "entities": ", ".join(domain.get("entities", [])),
+                "dependencies": ", ".join(domain.get("dependencies", [])) or "None",
+                "features": ", ".join(domain.get("feature_ids", [])),
+            }
+            for domain in variables.get("domains", [])
+        ]
 
         def replace_each(m):
             template = m.group(1)
-            result = []
-            for domain in domains:
-                item = template
-                item = item.replace("{{name}}", domain.get("name", ""))
-                item = item.replace("{{description}}", domain.get("description", ""))
-                item = item.replace("{{root_entity}}", domain.get("root_entity", ""))
-                item = item.replace("{{entities}}", ", ".join(domain.get("entities", [])))
-                item = item.replace("{{dependencies}}", ", ".join(domain.get("dependencies", [])) or "None")
-                features = domain.get("feature_ids", [])
-                item = item.replace("{{features}}", ", ".join(features))
-                result.append(item)
-            return "".join(result)
-
-        return re.sub(pattern, replace_each, text, flags=re.DOTALL)
-
-    content = process_each_domains(content)
+            # One alternation pass per domain replaces six sequential
+            # str.replace scans (and their intermediate strings).
+            return "".join(
+                _EACH_TOKEN_RE.sub(lambda tm: tokens[tm.group(1)], template)
+                for tokens in rendered
+            )
+
+        return _EACH_DOMAINS_RE.sub(replace_each, text)
+
+    if "{{#each" in content:
+        content = process_each_domains(content)
 
     return content
 
@@ -244,17 +328,20 @@ def apply_template_file(source_path: Path, target_path: Path, variables: Dict[st
     if not source_path.exists():
         return False
 
-    content = source_path.read_text()
-    content = substitute_variables(content, variables)
-
-    if not dry_run:
-        ensure_directory(target_path.parent)
-        # Remove .template extension if present
-        final_path = target_path
-        if final_path.suffix == ".template":
-            final_path = final_path.with_suffix("")
-        final_path.write_text(content)
+    # A dry run only reports which templates would be applied; skip the
+    # read and substitution work entirely.
+    if dry_run:
         return True
+
+    # Read and write as bytes; only the substitution pass needs str.
+    content = substitute_variables(source_path.read_bytes().decode("utf-8"), variables)
+
+    ensure_directory(target_path.parent)
+    # Remove .template extension if present
+    final_path = target_path
+    if final_path.suffix == ".template":
+        final_path = final_path.with_suffix("")
+    final_path.write_bytes(content.encode("utf-8"))
     return True
 
 
@@ -292,7 +379,7 @@ def create_domain_structure(project_root: Path, domains: List[Dict[str, Any]], d
         for file_path, content in frontend_files.items():
             if not dry_run:
                 ensure_directory(file_path.parent)
-                file_path.write_text(content)
+                file_path.write_bytes(content.encode("utf-8"))
                 files_created += 1
 
         # Backend domain structure (if TypeScript backend)
@@ -316,7 +403,7 @@ def create_domain_structure(project_root: Path, domains: List[Dict[str, Any]], d
                 if not file_path.exists():
                     if not dry_run:
                         ensure_directory(file_path.parent)
-                        file_path.write_text(content)
+                        file_path.write_bytes(content.encode("utf-8"))
                         files_created += 1
 
         domains_created.append({
@@ -328,56 +415,62 @@ def create_domain_structure(project_root: Path, domains: List[Dict[str, Any]], d
     return domains_created
 
 
+def _scan_templates(source_dir: Path) -> List[Path]:
+    """List *.template files in a directory with a single scandir pass.
+
+    One directory scan replaces glob's fnmatch machinery plus the
+    separate exists() stat; a missing directory just yields no entries.
+    """
+    try:
+        with os.scandir(source_dir) as it:
+            return [Path(entry.path) for entry in it
+                    if entry.name.endswith(".template") and entry.is_file()]
+    except FileNotFoundError:
+        return []
+
+
+# Template source locations, joined once at import time instead of
+# rebuilding the same PurePath objects on every injector call.
+_TPL_RULES_DIR = TEMPLATES_DIR / ".claude" / "rules"
+_TPL_UI_DIR = TEMPLATES_DIR / "src" / "components" / "ui"
+_TPL_CN = TEMPLATES_DIR / "src" / "utils" / "cn.ts.template"
+
+
 def inject_architecture_rules(project_root: Path, variables: Dict[str, Any], dry_run: bool) -> int:
     """Inject .claude/rules/ files into the project."""
     files_injected = 0
-    rules_source = TEMPLATES_DIR / ".claude" / "rules"
     rules_target = project_root / ".claude" / "rules"
 
-    if rules_source.exists():
-        for template_file in rules_source.glob("*.template"):
-            target_file = rules_target / template_file.name.replace(".template", "")
-            if apply_template_file(template_file, target_file, variables, dry_run):
-                files_injected += 1
+    for template_file in _scan_templates(_TPL_RULES_DIR):
+        target_file = rules_target / template_file.name.replace(".template", "")
+        if apply_template_file(template_file, target_file, variables, dry_run):
+            files_injected += 1
 
     return files_injected
 
 
+# Quality-tool templates as (source path, target relative to project
+# root, mark executable). One loop replaces four hand-rolled
+# exists/apply/increment blocks; sources are joined once at import.
+_QUALITY_TEMPLATES = (
+    (TEMPLATES_DIR / ".eslintrc.js.template", ".eslintrc.js", False),
+    (TEMPLATES_DIR / ".prettierrc.template", ".prettierrc", False),
+    (TEMPLATES_DIR / ".husky" / "pre-commit.template", ".husky/pre-commit", True),
+    (TEMPLATES_DIR / "tailwind.config.js.template", "tailwind.config.js", False),
+)
+
+
 def inject_quality_tools(project_root: Path, variables: Dict[str, Any], dry_run: bool) -> int:
     """Inject ESLint, Prettier, Husky configurations."""
     files_injected = 0
 
-    # ESLint
-    eslint_source = TEMPLATES_DIR / ".eslintrc.js.template"
-    if eslint_source.exists():
-        target = project_root / ".eslintrc.js"
-        if apply_template_file(eslint_source, target, variables, dry_run):
-            files_injected += 1
-
-    # Prettier
-    prettier_source = TEMPLATES_DIR / ".prettierrc.template"
-    if prettier_source.exists():
-        target = project_root / ".prettierrc"
-        if apply_template_file(prettier_source, target, variables, dry_run):
+    for source, target_rel, executable in _QUALITY_TEMPLATES:
+        target = project_root / target_rel
+        if apply_template_file(source, target, variables, dry_run):
             files_injected += 1
-
-    # Husky
-    husky_source = TEMPLATES_DIR / ".husky" / "pre-commit.template"
-    if husky_source.exists():
-        target = project_root / ".husky" / "pre-commit"
-        if apply_template_file(husky_source, target, variables, dry_run):
-            files_injected += 1
-            # Make pre-commit executable
-            if not dry_run and target.exists():
+            if executable and not dry_run and target.exists():
                 target.chmod(target.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
 
-    # Tailwind config
-    tailwind_source = TEMPLATES_DIR / "tailwind.config.js.template"
-    if tailwind_source.exists():
-        target = project_root / "tailwind.config.js"
-        if apply_template_file(tailwind_source, target, variables, dry_run):
-            files_injected += 1
-
     return files_injected
 
 
@@ -403,7 +496,11 @@ def inject_ai_context(project_root: Path, variables: Dict[str, Any], dry_run: bo
         if source.exists():
             if not dry_run:
                 ensure_directory(target.parent)
-                target.write_text(source.read_text())
+                # copyfile stays on the kernel copy path (copy_file_range
+                # on Linux) instead of decoding to str and re-encoding; an
+                # up-to-date target makes re-runs a pair of stats.
+                if not (target.exists() and target.stat().st_mtime >= source.stat().st_mtime):
+                    shutil.copyfile(source, target)
             files_injected += 1
 
     # Template files (with variable substitution) - for project-specific context
@@ -425,96 +522,166 @@ def inject_ai_context(project_root: Path, variables: Dict[str, Any], dry_run: bo
 def inject_design_system(project_root: Path, variables: Dict[str, Any], dry_run: bool) -> int:
     """Inject glassmorphism UI components."""
     files_injected = 0
-    ui_source = TEMPLATES_DIR / "src" / "components" / "ui"
     ui_target = project_root / "src" / "components" / "ui"
 
-    if ui_source.exists():
-        for template_file in ui_source.glob("*.template"):
-            target_file = ui_target / template_file.name.replace(".template", "")
-            if apply_template_file(template_file, target_file, variables, dry_run):
-                files_injected += 1
+    for template_file in _scan_templates(_TPL_UI_DIR):
+        target_file = ui_target / template_file.name.replace(".template", "")
+        if apply_template_file(template_file, target_file, variables, dry_run):
+            files_injected += 1
 
     # Also inject utils/cn.ts
-    utils_source = TEMPLATES_DIR / "src" / "utils" / "cn.ts.template"
-    if utils_source.exists():
-        target = project_root / "src" / "utils" / "cn.ts"
-        if apply_template_file(utils_source, target, variables, dry_run):
-            files_injected += 1
+    if apply_template_file(_TPL_CN, project_root / "src" / "utils" / "cn.ts", variables, dry_run):
+        files_injected += 1
 
     return files_injected
 
 
-def write_placeholder_file(path: Path, project_name: str) -> None:
-    ensure_directory(path.parent)
-    content = generate_placeholder_content(path, project_name)
-    if not path.exists():
-        path.write_text(content)
+def write_placeholder_file(path: Path, project_name: str) -> Optional[int]:
+    """Write a placeholder file; the parent directory must already exist.
 
+    O_EXCL makes the create atomic: existing files are left untouched
+    without a separate exists() probe, and the race between the check and
+    the write disappears. Content is only generated when the create wins.
 
-def generate_placeholder_content(path: Path, project_name: str) -> str:
-    """Generate placeholder content appropriate for the file type."""
-    suffix = path.suffix.lower()
+    Returns the number of bytes written, or None if the file already
+    existed, so the caller can report size without re-stat'ing the file.
+    """
+    try:
+        fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+    except FileExistsError:
+        return None
+    try:
+        encoded = _encode_placeholder(generate_placeholder_content(path, project_name))
+        os.write(fd, encoded)
+        return len(encoded)
+    finally:
+        os.close(fd)
+
+
+# Placeholder bodies, hoisted so each call does a single .format() over a
+# prebuilt literal instead of reassembling the template inline.
+_PY_PLACEHOLDER = (
+    '"""\nAuto-generated placeholder file.\n"""\n\n'
+    'if __name__ == "__main__":\n'
+    '    print("{project_name} placeholder: {path}")\n'
+)
+_TS_PLACEHOLDER = "// Auto-generated placeholder for {project_name}\nexport {{}}\n"
+_TSX_PLACEHOLDER = (
+    "// Auto-generated placeholder for {project_name}\n"
+    "export default function Placeholder() {{\n"
+    "  return (<div>Placeholder: {path}</div>);\n"
+    "}}\n"
+)
+_SQL_PLACEHOLDER = "-- Auto-generated placeholder migration for {project_name}\n-- File: {path}\n"
+_MD_PLACEHOLDER = "# Placeholder\n\nFile: {path}\nProject: {project_name}\n"
+_MAKEFILE_PLACEHOLDER = "# Placeholder Makefile\n\n.DEFAULT_GOAL := help\n\nhelp:\n\t@echo 'Replace with real Makefile content.'\n"
+_DEFAULT_PLACEHOLDER = "// Placeholder for {project_name}: {path}\n"
+
+
+@functools.lru_cache(maxsize=8)
+def _json_placeholder(project_name: str) -> str:
+    """Serialize the JSON placeholder once per project instead of per file."""
+    return json.dumps({"placeholder": True, "project": project_name}, indent=2)
+
+
+@functools.lru_cache(maxsize=256)
+def _encode_placeholder(content: str) -> bytes:
+    """Encode a placeholder body once per distinct content.
+
+    Many placeholders are identical across files (barrel exports, JSON
+    stubs, Makefiles), so the UTF-8 encode is paid once per distinct
+    body rather than once per file.
+    """
+    return content.encode("utf-8")
+
+
+def _gen_py(path: Path, project_name: str) -> str:
+    return _PY_PLACEHOLDER.format(project_name=project_name, path=path)
+
+
+def _gen_ts(path: Path, project_name: str) -> str:
     filename = path.name.lower()
+    nest_match = _NEST_PATTERN_RE.search(filename)
+    if nest_match:
+        return _generate_nestjs_placeholder(filename, nest_match.group(1))
+    return _TS_PLACEHOLDER.format(project_name=project_name)
+
+
+def _gen_tsx(path: Path, project_name: str) -> str:
+    return _TSX_PLACEHOLDER.format(project_name=project_name, path=path)
+
+
+def _gen_sql(path: Path, project_name: str) -> str:
+    return _SQL_PLACEHOLDER.format(project_name=project_name, path=path)
+
 
-    if suffix in {".py"}:
-        return (
-            '"""\nAuto-generated placeholder file.\n"""\n\n'
-            f'if __name__ == "__main__":\n'
-            f'    print("{project_name} placeholder: {path}")\n'
-        )
+def _gen_json(path: Path, project_name: str) -> str:
+    return _json_placeholder(project_name)
 
-    if suffix in {".ts", ".js"}:
-        if any(pattern in filename for pattern in ['.module.', '.service.', '.controller.', '.entity.', '.dto.']):
-            return _generate_nestjs_placeholder(path, project_name, filename)
-        return f"// Auto-generated placeholder for {project_name}\nexport {{}}\n"
 
-    if suffix in {".tsx", ".jsx"}:
-        return f"// Auto-generated placeholder for {project_name}\nexport default function Placeholder() {{\n  return (<div>Placeholder: {path}</div>);\n}}\n"
+def _gen_md(path: Path, project_name: str) -> str:
+    return _MD_PLACEHOLDER.format(project_name=project_name, path=path)
 
-    if suffix in {".sql"}:
-        return f"-- Auto-generated placeholder migration for {project_name}\n-- File: {path}\n"
 
-    if suffix in {".json"}:
-        return json.dumps({"placeholder": True, "project": project_name}, indent=2)
+# Suffix dispatch: one dict lookup per file instead of a cascade of
+# set-membership tests.
+_SUFFIX_HANDLERS = {
+    ".py": _gen_py,
+    ".ts": _gen_ts,
+    ".js": _gen_ts,
+    ".tsx": _gen_tsx,
+    ".jsx": _gen_tsx,
+    ".sql": _gen_sql,
+    ".json": _gen_json,
+    ".md": _gen_md,
+}
 
-    if suffix in {".md"}:
-        return f"# Placeholder\n\nFile: {path}\nProject: {project_name}\n"
 
+def generate_placeholder_content(path: Path, project_name: str) -> str:
+    """Generate placeholder content appropriate for the file type."""
     if path.name == "Makefile":
-        return "# Placeholder Makefile\n\n.DEFAULT_GOAL := help\n\nhelp:\n\t@echo 'Replace with real Makefile content.'\n"
+        return _MAKEFILE_PLACEHOLDER
+
+    handler = _SUFFIX_HANDLERS.get(path.suffix.lower())
+    if handler is not None:
+        return handler(path, project_name)
+    return _DEFAULT_PLACEHOLDER.format(project_name=project_name, path=path)
+
 
-    return f"// Placeholder for {project_name}: {path}\n"
+# NestJS file-kind markers, matched in one scan instead of one substring
+# probe per kind. The captured kind keys the template table below.
+_NEST_PATTERN_RE = re.compile(r"\.(module|service|controller|entity|dto)\.")
 
+# First two dotted segments of a NestJS filename ("users.service.ts" ->
+# "users", "service"), captured in one match instead of replace+split.
+_NEST_NAME_RE = re.compile(r"^([^.]*)\.([^.]+)\.")
 
-def _generate_nestjs_placeholder(path: Path, project_name: str, filename: str) -> str:
-    """Generate appropriate NestJS placeholder based on file type."""
-    parts = filename.replace('.ts', '').replace('.js', '').split('.')
-    if len(parts) >= 2:
-        base_name = ''.join(word.capitalize() for word in parts[0].split('-'))
-        file_type = parts[1].capitalize()
-        class_name = f"{base_name}{file_type}"
+_NEST_TEMPLATES = {
+    "module": "import {{ Module }} from '@nestjs/common';\n\n@Module({{}})\nexport class {class_name} {{}}\n",
+    "service": "import {{ Injectable }} from '@nestjs/common';\n\n@Injectable()\nexport class {class_name} {{}}\n",
+    "controller": "import {{ Controller }} from '@nestjs/common';\n\n@Controller()\nexport class {class_name} {{}}\n",
+    "entity": "import {{ Entity, PrimaryGeneratedColumn }} from 'typeorm';\n\n@Entity()\nexport class {class_name} {{\n  @PrimaryGeneratedColumn('uuid')\n  id!: string;\n}}\n",
+    "dto": "export class {class_name} {{}}\n",
+}
+
+
+def _generate_nestjs_placeholder(filename: str, kind: str) -> str:
+    """Generate the NestJS placeholder for a matched file kind."""
+    match = _NEST_NAME_RE.match(filename)
+    if match:
+        base_name = ''.join(word.capitalize() for word in match.group(1).split('-'))
+        class_name = f"{base_name}{match.group(2).capitalize()}"
     else:
         class_name = "Placeholder"
 
-    if '.module.' in filename:
-        return f"import {{ Module }} from '@nestjs/common';\n\n@Module({{}})\nexport class {class_name} {{}}\n"
-    elif '.service.' in filename:
-        return f"import {{ Injectable }} from '@nestjs/common';\n\n@Injectable()\nexport class {class_name} {{}}\n"
-    elif '.controller.' in filename:
-        return f"import {{ Controller }} from '@nestjs/common';\n\n@Controller()\nexport class {class_name} {{}}\n"
-    elif '.entity.' in filename:
-        return f"import {{ Entity, PrimaryGeneratedColumn }} from 'typeorm';\n\n@Entity()\nexport class {class_name} {{\n  @PrimaryGeneratedColumn('uuid')\n  id!: string;\n}}\n"
-    elif '.dto.' in filename:
-        return f"export class {class_name} {{}}\n"
-    else:
-        return f"export class {class_name} {{}}\n"
+    return _NEST_TEMPLATES[kind].format(class_name=class_name)
 
 
 def collect_fs_metadata(path: Path) -> Dict[str, Any]:
     st = path.stat()
     perm = stat.S_IMODE(st.st_mode)
     return {
-        "path": str(path).replace("\\", "/"),
+        "path": path.as_posix(),
         "size_bytes": st.st_size,
         "permissions": f"{perm:o}",
     }
@@ -535,7 +702,7 @@ def apply_plan(plan: Dict[str, Any], prd: Dict[str, Any], erd: Dict[str, Any], p
     # 1. Create directory structure
     directory_structure = data.get("directory_structure", {})
     for dir_path in directory_structure.keys():
-        target_dir = (project_root / dir_path).resolve()
+        target_dir = safe_join(project_root, dir_path)
         if not dry_run:
             ensure_directory(target_dir)
 
@@ -591,7 +758,8 @@ def apply_plan(plan: Dict[str, Any], prd: Dict[str, Any], erd: Dict[str, Any], p
         target_path = template.get("target_path", "")
         files = template.get("files_to_generate", [])
 
-        created_count = 0
+        # First pass: pure path math, no filesystem access.
+        file_paths = []
         for rel_file in files:
             normalized_target = target_path.lstrip('/').rstrip('/')
             if normalized_target and not rel_file.startswith(normalized_target):
@@ -599,12 +767,45 @@ def apply_plan(plan: Dict[str, Any], prd: Dict[str, Any], erd: Dict[str, Any], p
             else:
                 full_path = rel_file
 
-            file_path = (project_root / full_path).resolve()
-            if not dry_run:
-                write_placeholder_file(file_path, project_name)
-            if file_path.exists():
-                files_created.append(collect_fs_metadata(file_path))
-                created_count += 1
+            file_paths.append(safe_join(project_root, full_path))
+
+        if dry_run:
+            # Report what would be created without touching the
+            # filesystem: no writes, no exists() probes, no stats.
+            created_count = len(file_paths)
+            files_created.extend(
+                {"path": p.as_posix(), "size_bytes": 0, "permissions": "644"}
+                for p in file_paths
+            )
+        else:
+            # Second pass: the writes are independent, so overlap their
+            # syscall latency across a small thread pool. Parent
+            # directories are created up front, once per unique
+            # directory, so the write path itself issues no mkdir calls.
+            written: List[Optional[int]] = []
+            if file_paths:
+                for parent in {p.parent for p in file_paths}:
+                    ensure_directory(parent)
+                with ThreadPoolExecutor(max_workers=min(8, len(file_paths))) as executor:
+                    written = list(executor.map(
+                        lambda p: write_placeholder_file(p, project_name), file_paths))
+
+            created_count = 0
+            for file_path, size in zip(file_paths, written):
+                if size is not None:
+                    # The writer just created the file with mode 0o644 and
+                    # reported the byte count, so no stat is needed.
+                    files_created.append({
+                        "path": file_path.as_posix(),
+                        "size_bytes": size,
+                        "permissions": "644",
+                    })
+                    created_count += 1
+                elif file_path.exists():
+                    # Pre-existing file left untouched; fall back to stat
+                    # for its actual size and mode.
+                    files_created.append(collect_fs_metadata(file_path))
+                    created_count += 1
 
         templates_applied.append({
             "template_id": template_id,
@@ -634,7 +835,7 @@ def emit_error(code: str, message: str, details: List[str]) -> None:
             "remediation": "Check template paths, approvals, and input artifacts"
         }
     }
-    print(json.dumps(err, indent=2))
+    sys.stdout.buffer.write(orjson.dumps(err, option=orjson.OPT_INDENT_2) + b"\n")
     sys.exit(1)
 
 
@@ -647,6 +848,8 @@ def main() -> None:
     parser.add_argument("--output", required=True, help="Path to write scaffold_applied JSON result")
     parser.add_argument("--project-dir", help="Target directory for generated project")
     parser.add_argument("--dry-run", action="store_true", help="Validate and report without creating files")
+    parser.add_argument("--trust-inputs", action="store_true",
+                        help="Skip Pydantic validation of already-linted inputs")
 
     args = parser.parse_args()
 
@@ -666,7 +869,7 @@ def main() -> None:
         project_root = (factory_root / ".." / "generated-projects" / project_name_slug).resolve()
 
     try:
-        prd, erd, plan = validate_inputs(prd_path, erd_path, plan_path)
+        prd, erd, plan = validate_inputs(prd_path, erd_path, plan_path, args.trust_inputs)
         require_approval(args.approved_by)
 
         apply_results = apply_plan(plan, prd, erd, project_root, args.dry_run)
@@ -684,19 +887,15 @@ def main() -> None:
                 "applied_at": now,
                 "mode": "apply",
                 **apply_results,
-                "setup_instructions": [
-                    "Run 'npm install' to install dependencies",
-                    "Run 'npx husky install' to set up git hooks",
-                    "Copy .env.example to .env and fill in values",
-                    "Run 'npm run db:generate' to generate Prisma client",
-                    "Run 'npm run dev' to start development server"
-                ]
+                "setup_instructions": list(SETUP_INSTRUCTIONS)
             }
         }
 
+        # Serialize once; the same bytes go to the output file and stdout.
+        payload = orjson.dumps(result, option=orjson.OPT_INDENT_2)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(json.dumps(result, indent=2))
-        print(json.dumps(result, indent=2))
+        output_path.write_bytes(payload)
+        sys.stdout.buffer.write(payload + b"\n")
         sys.exit(0)
 
     except PermissionError as e: